@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the FleTodo data structures.
+
+Usage:
+    python benchmark.py store [--sizes 10000 100000]
+    python benchmark.py memory [--count 1000000]
+    python benchmark.py search [--sizes 10000 100000]
+    python benchmark.py app [--sizes 100 10000 100000] [--save-baseline FILE] [--baseline FILE]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fake_page import FakePage
+from todo_app import TodoApp
+from todo_io import write_todos
+from todo_store import TodoItem, TodoStore
+
+
+def make_todos(count: int):
+    """Create `count` todos with distinct creation times, a third of them completed."""
+    start = datetime(2024, 1, 1)
+    return [
+        TodoItem(
+            f"Todo {i}",
+            creation_time=(start + timedelta(seconds=i)).isoformat(),
+            completed=(i % 3 == 0),
+            todo_id=f"todo-{i}"
+        )
+        for i in range(count)
+    ]
+
+
+def time_per_op(func, args_list) -> float:
+    """Run func once per argument and return the mean time in microseconds."""
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+def bench_store(sizes, ops: int = 1000):
+    """Compare TodoStore operations with the previous list-based approach."""
+    print("📊 TodoStore per-operation cost (µs)")
+    print(f"{'items':>8} {'operation':<10} {'list':>12} {'TodoStore':>12}")
+
+    for size in sizes:
+        todos = make_todos(size)
+        store = TodoStore(todos)
+        legacy = list(todos)
+        ids = [todo.id for todo in random.Random(size).sample(todos, min(ops, size))]
+        new_items = make_todos(size + len(ids))[size:]
+
+        def legacy_toggle(todo_id):
+            for todo in legacy:
+                if todo.id == todo_id:
+                    todo.completed = not todo.completed
+                    break
+            sorted(legacy, key=lambda x: (x.completed, x.creation_time))
+
+        def legacy_add(todo):
+            legacy.append(todo)
+            sorted(legacy, key=lambda x: (x.completed, x.creation_time))
+
+        def legacy_delete(todo_id):
+            nonlocal legacy
+            legacy = [todo for todo in legacy if todo.id != todo_id]
+            sorted(legacy, key=lambda x: (x.completed, x.creation_time))
+
+        # The list approach is O(n log n) per operation, so sample fewer ops
+        legacy_ops = max(1, min(len(ids), 2_000_000 // size))
+        results = [
+            ("toggle", time_per_op(legacy_toggle, [(i,) for i in ids[:legacy_ops]]),
+             time_per_op(store.toggle, [(i,) for i in ids])),
+            ("add", time_per_op(legacy_add, [(t,) for t in new_items[:legacy_ops]]),
+             time_per_op(store.add, [(t,) for t in new_items])),
+            ("delete", time_per_op(legacy_delete, [(i,) for i in ids[:legacy_ops]]),
+             time_per_op(store.remove, [(i,) for i in ids])),
+        ]
+        for name, legacy_us, store_us in results:
+            print(f"{size:>8} {name:<10} {legacy_us:>12.1f} {store_us:>12.1f}")
+
+
+def bench_search(sizes, queries=("todo 1", "todo", "99", "todo 12345", "missing")):
+    """Time search index construction and queries."""
+    print("📊 Search (ms)")
+    print(f"{'items':>8} {'query':<12} {'index':>9} {'linear':>9} {'matches':>9}")
+
+    for size in sizes:
+        todos = make_todos(size)
+        start = time.perf_counter()
+        store = TodoStore(todos)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"{size:>8} {'(build)':<12} {build_ms:>9.1f}")
+
+        for query in queries:
+            # First query pays for sorting the vocabulary; time a warm one
+            list(store.search(query))
+            start = time.perf_counter()
+            matches = list(store.search(query))
+            index_ms = (time.perf_counter() - start) * 1000
+
+            words = query.lower().split()
+            start = time.perf_counter()
+            [t for t in store if all(any(w.startswith(q) for w in t.name.lower().split()) for q in words)]
+            linear_ms = (time.perf_counter() - start) * 1000
+            print(f"{size:>8} {query!r:<12} {index_ms:>9.2f} {linear_ms:>9.2f} {len(matches):>9}")
+
+
+class LegacyTodoItem:
+    """TodoItem as it was before __slots__: a __dict__ and an ISO creation_time."""
+
+    def __init__(self, name: str, creation_time: str, completed: bool, todo_id: str):
+        self.name = name
+        self.creation_time = creation_time
+        self.completed = completed
+        self.id = todo_id
+
+    @property
+    def display_time(self) -> str:
+        return datetime.fromisoformat(self.creation_time).strftime("%m/%d/%Y %H:%M")
+
+
+def measure_items(factory, count: int):
+    """Return (bytes allocated, items) for `count` items built by factory(i)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, items
+
+
+def bench_memory(count: int, renders: int = 3):
+    """Compare per-item memory and display formatting of old and new TodoItems."""
+    start = datetime(2024, 1, 1).timestamp()
+    names = [f"Todo {i}" for i in range(count)]
+    ids = [f"todo-{i}" for i in range(count)]
+
+    legacy_bytes, legacy = measure_items(
+        lambda i: LegacyTodoItem(names[i], datetime.fromtimestamp(start + i).isoformat(), False, ids[i]),
+        count
+    )
+    slotted_bytes, slotted = measure_items(
+        lambda i: TodoItem(names[i], todo_id=ids[i], created_at=start + i),
+        count
+    )
+
+    def render_time(items) -> float:
+        # Format every display string `renders` times, like repeated re-renders
+        t0 = time.perf_counter()
+        for _ in range(renders):
+            for item in items:
+                item.display_time
+        return time.perf_counter() - t0
+
+    print(f"📊 TodoItem memory and formatting for {count:,} items")
+    print(f"{'':<10} {'total MB':>10} {'bytes/item':>12} {f'{renders} renders (s)':>16}")
+    print(f"{'legacy':<10} {legacy_bytes / 1e6:>10.1f} {legacy_bytes / count:>12.1f} {render_time(legacy):>16.2f}")
+    print(f"{'slotted':<10} {slotted_bytes / 1e6:>10.1f} {slotted_bytes / count:>12.1f} {render_time(slotted):>16.2f}")
+    print("(names and ids are shared by both variants and not counted)")
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_app_op(page: FakePage, action, results: dict):
+    """Run one TodoApp action and add its latency and side effects to results."""
+    before = page.stats()
+    start = time.perf_counter()
+    action()
+    results["latency"].append((time.perf_counter() - start) * 1000)
+    after = page.stats()
+    for key in ("updates", "payload_bytes", "controls_added", "storage_bytes"):
+        results[key].append(after[key] - before[key])
+
+
+def bench_app_size(size: int, ops: int, tmp: str) -> dict:
+    """Drive a headless TodoApp holding `size` todos; return per-operation metrics."""
+    page = FakePage()
+    # Write-through saving so every byte persisted is attributed to its operation
+    app = TodoApp(page, save_delay=0)
+    app.store.replace(make_todos(size))
+    app.save_todos()
+    app.update_todo_list()
+    page.update()
+
+    path = os.path.join(tmp, f"todos-{size}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        write_todos(f, make_todos(size))
+    file_event = SimpleNamespace(files=[SimpleNamespace(path=path)], path=path)
+    # Seeded per size so every run (and the saved baseline) picks the same
+    # todos, in or out of the render window alike
+    rng = random.Random(size)
+
+    def add():
+        app.todo_input.value = "Benchmark todo"
+        app.add_todo()
+
+    def toggle():
+        app.toggle_todo_completed(app.store.at(rng.randrange(len(app.store))).id)
+
+    def delete():
+        app.delete_todo(app.store.at(rng.randrange(len(app.store))).id)
+
+    def export():
+        app.export_todos_to_file(file_event).join()
+
+    def import_():
+        app.import_todos_from_file(file_event)
+
+    # Whole-file operations are expensive at large sizes; run them less often
+    file_ops = max(1, min(ops, 200_000 // size))
+    actions = [
+        ("add", add, ops),
+        ("toggle", toggle, ops),
+        ("delete", delete, ops),
+        ("export", export, file_ops),
+        ("import", import_, file_ops),
+    ]
+    metrics = {}
+    for name, action, count in actions:
+        results = {key: [] for key in ("latency", "updates", "payload_bytes", "controls_added", "storage_bytes")}
+        for _ in range(count):
+            run_app_op(page, action, results)
+        latency = results.pop("latency")
+        metrics[name] = {
+            "p50_ms": percentile(latency, 50),
+            "p90_ms": percentile(latency, 90),
+            "p99_ms": percentile(latency, 99),
+            **{key: statistics.mean(values) for key, values in results.items()},
+        }
+    return metrics
+
+
+def bench_app(sizes, ops: int, save_baseline: str = None, baseline: str = None,
+              threshold: float = 1.25) -> bool:
+    """Benchmark TodoApp operations headlessly; return False on a regression."""
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            report[str(size)] = bench_app_size(size, ops, tmp)
+
+    print("📊 TodoApp per-operation metrics (mean per op, latency in ms)")
+    print(f"{'items':>8} {'operation':<9} {'p50':>9} {'p90':>9} {'p99':>9} "
+          f"{'updates':>8} {'payload B':>10} {'controls':>9} {'stored B':>10}")
+    for size, metrics in report.items():
+        for name, m in metrics.items():
+            print(f"{size:>8} {name:<9} {m['p50_ms']:>9.2f} {m['p90_ms']:>9.2f} {m['p99_ms']:>9.2f} "
+                  f"{m['updates']:>8.1f} {m['payload_bytes']:>10.0f} {m['controls_added']:>9.1f} "
+                  f"{m['storage_bytes']:>10.0f}")
+
+    if save_baseline:
+        with open(save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Saved baseline to {save_baseline}")
+
+    ok = True
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            reference = json.load(f)
+        print(f"\n🔍 Comparing against {baseline} (threshold {threshold:.2f}x)")
+        for size, metrics in report.items():
+            for name, m in metrics.items():
+                ref = reference.get(size, {}).get(name)
+                if not ref:
+                    continue
+                for key in ("p50_ms", "payload_bytes", "controls_added", "storage_bytes"):
+                    # Ignore tiny absolute values where noise dominates
+                    floor = 0.05 if key == "p50_ms" else 1
+                    if m[key] > max(ref[key], floor) * threshold:
+                        ok = False
+                        print(f"   ❌ {size} {name} {key}: {ref[key]:.2f} -> {m[key]:.2f}")
+        if ok:
+            print("   ✅ No regressions")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FleTodo benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    store_parser = subparsers.add_parser("store", help="TodoStore operation cost")
+    store_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    store_parser.add_argument("--ops", type=int, default=1000)
+
+    memory_parser = subparsers.add_parser("memory", help="TodoItem memory footprint")
+    memory_parser.add_argument("--count", type=int, default=1_000_000)
+
+    search_parser = subparsers.add_parser("search", help="Search index queries")
+    search_parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+
+    app_parser = subparsers.add_parser("app", help="Headless TodoApp operations")
+    app_parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    app_parser.add_argument("--ops", type=int, default=100)
+    app_parser.add_argument("--save-baseline", metavar="FILE", help="write results as a baseline")
+    app_parser.add_argument("--baseline", metavar="FILE", help="compare with a saved baseline")
+    app_parser.add_argument("--threshold", type=float, default=1.25,
+                            help="ratio over the baseline that counts as a regression")
+
+    args = parser.parse_args()
+    if args.command == "store":
+        bench_store(args.sizes, args.ops)
+    elif args.command == "search":
+        bench_search(args.sizes)
+    elif args.command == "memory":
+        bench_memory(args.count)
+    elif args.command == "app":
+        if not bench_app(args.sizes, args.ops, args.save_baseline, args.baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
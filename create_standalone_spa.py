@@ -107,7 +107,7 @@ def create_html_file(release_dir):
         
         <footer class="app-footer">
             <p>Built with ❤️ using HTML, CSS & JavaScript</p>
-            <p class="storage-info">Data is saved in your browser's local storage</p>
+            <p class="storage-info">Data is saved in your browser's IndexedDB storage</p>
         </footer>
     </div>
     
@@ -259,10 +259,16 @@ body {
     flex-direction: column;
     gap: 15px;
     overflow-y: auto;
+    /* Rows above the viewport come and go while scrolling */
+    overflow-anchor: none;
     flex: 1;
     padding-right: 5px;
 }
 
+.list-spacer {
+    flex-shrink: 0;
+}
+
 /* Custom scrollbar styling */
 .todo-list::-webkit-scrollbar {
     width: 8px;
@@ -298,6 +304,10 @@ body {
     border-radius: 12px;
     background: white;
     transition: all 0.3s ease;
+    flex-shrink: 0;
+}
+
+.todo-item.entering {
     animation: slideIn 0.3s ease;
 }
 
@@ -321,6 +331,7 @@ body {
 
 .todo-content {
     flex: 1;
+    min-width: 0;
     display: flex;
     flex-direction: column;
     gap: 5px;
@@ -330,6 +341,10 @@ body {
     font-size: 16px;
     color: #333;
     transition: all 0.3s ease;
+    /* One line per todo keeps every row the same height for windowing */
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
 }
 
 .todo-item.completed .todo-text {
@@ -459,16 +474,207 @@ def create_js_file(release_dir):
     """Create the JavaScript functionality file."""
     js_content = """// FleTodo JavaScript Application
 
+// localStorage key the todos were kept under before IndexedDB
+const LEGACY_STORAGE_KEY = 'fleTodos';
+
+// IndexedDB database holding one record per todo
+const TODO_DB = { name: 'fleTodo', version: 1, store: 'todos', index: 'completed_createdAt' };
+
+// Rows rendered beyond each edge of the visible part of the list
+const ROW_OVERSCAN = 10;
+// Row height (including the gap) assumed until a row has been measured
+const ESTIMATED_ROW_STRIDE = 80;
+
+function toTimestamp(createdAt) {
+    // Todos saved before timestamps were numbers carry ISO strings
+    if (typeof createdAt === 'number') {
+        return createdAt;
+    }
+    const timestamp = Date.parse(createdAt);
+    return Number.isNaN(timestamp) ? Date.now() : timestamp;
+}
+
+class IndexedDBTodoStore {
+    // One record per todo in the 'todos' object store. IndexedDB keys
+    // cannot be booleans, so records keep completed as 0 or 1 for the
+    // completed+createdAt index that loads todos in display order.
+    static open() {
+        return new Promise((resolve, reject) => {
+            const request = indexedDB.open(TODO_DB.name, TODO_DB.version);
+            let migrated = false;
+            request.onupgradeneeded = () => {
+                const store = request.result.createObjectStore(TODO_DB.store, { keyPath: 'id' });
+                store.createIndex(TODO_DB.index, ['completed', 'createdAt']);
+                // Move todos saved by earlier versions into the new database;
+                // the upgrade transaction commits them together with the schema
+                for (const todo of IndexedDBTodoStore.legacyTodos()) {
+                    store.put(IndexedDBTodoStore.toRecord(todo));
+                }
+                migrated = true;
+            };
+            request.onsuccess = () => {
+                const db = request.result;
+                if (migrated) {
+                    IndexedDBTodoStore.removeLegacyTodos();
+                    resolve(new IndexedDBTodoStore(db));
+                    return;
+                }
+                // Todos saved to localStorage by a session that could not
+                // open IndexedDB are copied over before the key is removed
+                const leftover = IndexedDBTodoStore.legacyTodos();
+                if (leftover.length === 0) {
+                    resolve(new IndexedDBTodoStore(db));
+                    return;
+                }
+                const transaction = db.transaction(TODO_DB.store, 'readwrite');
+                const store = transaction.objectStore(TODO_DB.store);
+                for (const todo of leftover) {
+                    store.put(IndexedDBTodoStore.toRecord(todo));
+                }
+                transaction.oncomplete = () => {
+                    IndexedDBTodoStore.removeLegacyTodos();
+                    resolve(new IndexedDBTodoStore(db));
+                };
+                // Keep the key so that the next open tries again
+                transaction.onabort = () => {
+                    console.error('❌ Error migrating todos:', transaction.error);
+                    resolve(new IndexedDBTodoStore(db));
+                };
+            };
+            request.onerror = () => reject(request.error);
+        });
+    }
+    
+    static removeLegacyTodos() {
+        try {
+            localStorage.removeItem(LEGACY_STORAGE_KEY);
+        } catch (error) {
+            console.error('❌ Error removing migrated todos:', error);
+        }
+    }
+    
+    static legacyTodos() {
+        try {
+            const saved = localStorage.getItem(LEGACY_STORAGE_KEY);
+            return saved ? JSON.parse(saved) : [];
+        } catch (error) {
+            console.error('❌ Error reading todos to migrate:', error);
+            return [];
+        }
+    }
+    
+    static toRecord(todo) {
+        return { ...todo, completed: todo.completed ? 1 : 0, createdAt: toTimestamp(todo.createdAt) };
+    }
+    
+    static fromRecord(record) {
+        return { ...record, completed: record.completed === 1 };
+    }
+    
+    constructor(db) {
+        this.db = db;
+        this.name = 'IndexedDB';
+    }
+    
+    load() {
+        return new Promise((resolve, reject) => {
+            const request = this.db.transaction(TODO_DB.store)
+                .objectStore(TODO_DB.store)
+                .index(TODO_DB.index)
+                .getAll();
+            request.onsuccess = () => resolve(request.result.map(IndexedDBTodoStore.fromRecord));
+            request.onerror = () => reject(request.error);
+        });
+    }
+    
+    put(todo) {
+        return this.write(store => store.put(IndexedDBTodoStore.toRecord(todo)));
+    }
+    
+    delete(id) {
+        return this.write(store => store.delete(id));
+    }
+    
+    write(operation) {
+        // Each change is its own small transaction; IndexedDB runs them in
+        // the order they were started, off the main thread
+        return new Promise((resolve, reject) => {
+            const transaction = this.db.transaction(TODO_DB.store, 'readwrite');
+            operation(transaction.objectStore(TODO_DB.store));
+            transaction.oncomplete = () => resolve();
+            transaction.onerror = () => reject(transaction.error);
+            transaction.onabort = () => reject(transaction.error);
+        });
+    }
+}
+
+class LocalStorageTodoStore {
+    // Fallback for browsers without a usable IndexedDB (e.g. some private
+    // modes): the whole list is saved as one JSON array on every change
+    constructor() {
+        this.todos = new Map();
+        this.name = 'localStorage';
+    }
+    
+    async load() {
+        const saved = localStorage.getItem(LEGACY_STORAGE_KEY);
+        const todos = saved ? JSON.parse(saved) : [];
+        this.todos = new Map(todos.map(todo => [todo.id, todo]));
+        return todos;
+    }
+    
+    async put(todo) {
+        this.todos.set(todo.id, todo);
+        this.save();
+    }
+    
+    async delete(id) {
+        this.todos.delete(id);
+        this.save();
+    }
+    
+    save() {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify([...this.todos.values()]));
+    }
+}
+
+async function openTodoStore() {
+    if (typeof indexedDB !== 'undefined') {
+        try {
+            return await IndexedDBTodoStore.open();
+        } catch (error) {
+            console.error('❌ IndexedDB unavailable, using localStorage:', error);
+        }
+    }
+    return new LocalStorageTodoStore();
+}
+
 class FleTodoApp {
     constructor() {
-        this.todos = [];
+        // Todos by id, plus the pending and completed todos each kept sorted
+        // by creation time (a number), so rendering never has to sort
+        this.todoById = new Map();
+        this.pending = [];
+        this.completed = [];
+        // Only the rows in view (plus ROW_OVERSCAN on each side) are in the
+        // DOM, between two spacers standing in for the rows around them.
+        // Rendered row elements are keyed by todo id and reused across
+        // renders; rows scrolled out of view are kept to show other todos.
+        this.rowNodes = new Map();
+        this.spareRows = [];
+        this.topSpacer = this.createSpacer();
+        this.bottomSpacer = this.createSpacer();
+        this.rowStride = ESTIMATED_ROW_STRIDE;
+        this.rowGap = 0;
+        // Todos added since the last render, which get the slide-in animation
+        this.addedIds = new Set();
+        this.emptyState = null;
+        this.renderScheduled = false;
+        this.storage = openTodoStore();
         this.init();
     }
     
     init() {
-        // Load existing todos from localStorage
-        this.loadTodos();
-        
         // Set up event listeners
         this.setupEventListeners();
         
@@ -478,6 +684,9 @@ class FleTodoApp {
         // Focus on input
         document.getElementById('todoInput').focus();
         
+        // Load existing todos from IndexedDB (or localStorage)
+        this.loaded = this.loadTodos();
+        
         console.log('🚀 FleTodo initialized successfully!');
     }
     
@@ -501,6 +710,34 @@ class FleTodoApp {
                 todoInput.select();
             }
         });
+        
+        // One listener for all rows: the row's data-id names the todo and
+        // the control's data-action what to do with it
+        const todoList = document.getElementById('todoList');
+        todoList.addEventListener('change', (e) => this.handleRowEvent(e, 'toggle'));
+        todoList.addEventListener('click', (e) => this.handleRowEvent(e, 'delete'));
+        // Slide a new row in once; a row moved later must not replay it
+        todoList.addEventListener('animationend', (e) => e.target.classList.remove('entering'));
+        
+        // Render the rows coming into view
+        todoList.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+        window.addEventListener('resize', () => this.scheduleRender());
+    }
+    
+    handleRowEvent(e, action) {
+        const control = e.target.closest('[data-action]');
+        if (!control || control.dataset.action !== action) {
+            return;
+        }
+        const row = control.closest('[data-id]');
+        if (!row) {
+            return;
+        }
+        if (action === 'toggle') {
+            this.toggleTodo(row.dataset.id);
+        } else if (action === 'delete') {
+            this.deleteTodo(row.dataset.id);
+        }
     }
     
     addTodo() {
@@ -518,14 +755,15 @@ class FleTodoApp {
             id: this.generateId(),
             text: text,
             completed: false,
-            createdAt: new Date().toISOString()
+            createdAt: Date.now()
         };
         
-        this.todos.push(todo);
+        this.insertTodo(todo);
+        this.addedIds.add(todo.id);
         todoInput.value = '';
         
-        this.saveTodos();
-        this.renderTodoList();
+        this.saveTodo(todo);
+        this.scheduleRender();
         
         // Focus back on input
         todoInput.focus();
@@ -534,120 +772,368 @@ class FleTodoApp {
     }
     
     toggleTodo(id) {
-        const todo = this.todos.find(t => t.id === id);
+        const todo = this.todoById.get(id);
         if (todo) {
+            this.removeSorted(this.partitionOf(todo), todo);
             todo.completed = !todo.completed;
-            this.saveTodos();
-            this.renderTodoList();
+            this.insertSorted(this.partitionOf(todo), todo);
+            this.saveTodo(todo);
+            this.scheduleRender();
             
             console.log(todo.completed ? '✅ Completed:' : '⭕ Uncompleted:', todo.text);
         }
     }
     
     deleteTodo(id) {
-        const todoIndex = this.todos.findIndex(t => t.id === id);
-        if (todoIndex !== -1) {
-            const todo = this.todos[todoIndex];
+        const todo = this.todoById.get(id);
+        if (todo) {
+            const remove = () => {
+                if (this.todoById.get(todo.id) === todo) {
+                    this.todoById.delete(todo.id);
+                    this.removeSorted(this.partitionOf(todo), todo);
+                    this.write(storage => storage.delete(todo.id));
+                    this.scheduleRender();
+                }
+            };
             
             // Add removing animation
-            const todoElement = document.querySelector(`[data-id="${id}"]`);
+            const todoElement = this.rowNodes.get(id);
             if (todoElement) {
                 todoElement.classList.add('removing');
-                
-                setTimeout(() => {
-                    this.todos.splice(todoIndex, 1);
-                    this.saveTodos();
-                    this.renderTodoList();
-                }, 300);
+                setTimeout(remove, 300);
+            } else {
+                remove();
             }
             
             console.log('🗑️ Deleted todo:', todo.text);
         }
     }
     
+    partitionOf(todo) {
+        return todo.completed ? this.completed : this.pending;
+    }
+    
+    insertTodo(todo) {
+        this.todoById.set(todo.id, todo);
+        this.insertSorted(this.partitionOf(todo), todo);
+    }
+    
+    insertSorted(list, todo) {
+        // Binary search for the slot after all todos created no later
+        let low = 0;
+        let high = list.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (list[mid].createdAt <= todo.createdAt) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        list.splice(low, 0, todo);
+    }
+    
+    removeSorted(list, todo) {
+        // Binary search for the first todo created at the same time, then
+        // step over any others sharing that timestamp
+        let low = 0;
+        let high = list.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (list[mid].createdAt < todo.createdAt) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        while (low < list.length && list[low] !== todo && list[low].createdAt === todo.createdAt) {
+            low++;
+        }
+        if (list[low] === todo) {
+            list.splice(low, 1);
+        }
+    }
+    
+    scheduleRender() {
+        // Coalesce all changes made during one frame into a single render
+        if (this.renderScheduled) {
+            return;
+        }
+        this.renderScheduled = true;
+        requestAnimationFrame(() => {
+            this.renderScheduled = false;
+            this.renderTodoList();
+        });
+    }
+    
     renderTodoList() {
         const todoList = document.getElementById('todoList');
         
-        if (this.todos.length === 0) {
-            todoList.innerHTML = `
-                <div class="empty-state">
-                    <p>No todos yet. Add one above!</p>
-                </div>
-            `;
+        const total = this.todoById.size;
+        
+        if (total === 0) {
+            this.rowNodes.clear();
+            this.spareRows = [];
+            this.addedIds.clear();
+            todoList.replaceChildren(this.getEmptyState(todoList));
+            document.title = 'FleTodo';
             return;
         }
         
-        // Sort todos: incomplete first, then by creation time
-        const sortedTodos = [...this.todos].sort((a, b) => {
-            if (a.completed !== b.completed) {
-                return a.completed ? 1 : -1;
-            }
-            return new Date(a.createdAt) - new Date(b.createdAt);
-        });
+        if (this.topSpacer.parentNode !== todoList) {
+            todoList.replaceChildren(this.topSpacer, this.bottomSpacer);
+        }
         
-        todoList.innerHTML = sortedTodos.map(todo => `
-            <div class="todo-item ${todo.completed ? 'completed' : ''}" data-id="${todo.id}">
-                <input 
-                    type="checkbox" 
-                    class="todo-checkbox" 
-                    ${todo.completed ? 'checked' : ''}
-                    onchange="app.toggleTodo('${todo.id}')"
-                >
-                <div class="todo-content">
-                    <div class="todo-text">${this.escapeHtml(todo.text)}</div>
-                    <div class="todo-time">${this.formatDate(todo.createdAt)}</div>
-                </div>
-                <button 
-                    class="delete-btn" 
-                    onclick="app.deleteTodo('${todo.id}')"
-                    title="Delete todo"
-                >
-                    🗑️
-                </button>
-            </div>
-        `).join('');
+        // Window of rows overlapping the viewport, plus the overscan
+        // (the list may just have shrunk below the current scroll position)
+        const stride = this.rowStride;
+        const viewport = todoList.clientHeight;
+        const scrollTop = Math.min(todoList.scrollTop, Math.max(0, total * stride - viewport));
+        const first = Math.floor(scrollTop / stride);
+        const last = Math.ceil((scrollTop + viewport) / stride);
+        const start = Math.min(Math.max(0, first - ROW_OVERSCAN), total);
+        const end = Math.min(total, Math.max(start, last + ROW_OVERSCAN));
+        
+        this.setSpacerHeight(this.topSpacer, start);
+        this.reconcile(todoList, this.todosBetween(start, end));
+        this.setSpacerHeight(this.bottomSpacer, total - end);
+        this.spareRows.length = Math.min(this.spareRows.length, end - start);
+        this.addedIds.clear();
+        
+        // Row height depends on the viewport and font; once measured, the
+        // window is recomputed with it
+        if (this.measureRowStride(todoList) !== stride) {
+            this.scheduleRender();
+        }
         
         // Update document title with todo count
-        const pendingCount = this.todos.filter(t => !t.completed).length;
+        const pendingCount = this.pending.length;
         document.title = pendingCount > 0 ? `FleTodo (${pendingCount})` : 'FleTodo';
     }
     
-    saveTodos() {
-        try {
-            localStorage.setItem('fleTodos', JSON.stringify(this.todos));
-        } catch (error) {
-            console.error('❌ Error saving todos:', error);
+    todosBetween(start, end) {
+        // Todos at display positions start to end: incomplete first, then
+        // completed, each already in creation order
+        const pendingCount = this.pending.length;
+        return this.pending.slice(start, Math.min(end, pendingCount)).concat(
+            this.completed.slice(Math.max(0, start - pendingCount), Math.max(0, end - pendingCount))
+        );
+    }
+    
+    createSpacer() {
+        const spacer = document.createElement('div');
+        spacer.className = 'list-spacer';
+        spacer.setAttribute('aria-hidden', 'true');
+        return spacer;
+    }
+    
+    setSpacerHeight(spacer, rows) {
+        // The list's gap is added after the spacer, so leave it out of the
+        // height; an empty spacer is hidden so that it adds no gap at all
+        spacer.style.display = rows > 0 ? '' : 'none';
+        spacer.style.height = rows > 0 ? `${rows * this.rowStride - this.rowGap}px` : '0px';
+    }
+    
+    measureRowStride(todoList) {
+        const row = this.topSpacer.nextSibling;
+        if (row && row !== this.bottomSpacer) {
+            this.rowGap = parseFloat(getComputedStyle(todoList).rowGap) || 0;
+            const stride = row.getBoundingClientRect().height + this.rowGap;
+            if (stride > 0 && Math.abs(stride - this.rowStride) > 0.5) {
+                this.rowStride = stride;
+            }
         }
+        return this.rowStride;
     }
     
-    loadTodos() {
-        try {
-            const saved = localStorage.getItem('fleTodos');
-            if (saved) {
-                this.todos = JSON.parse(saved);
-                console.log(`📥 Loaded ${this.todos.length} todos from storage`);
+    reconcile(todoList, todos) {
+        // Patch the rendered rows between the spacers into the given order,
+        // keyed by todo id
+        const wanted = new Set(todos.map(todo => todo.id));
+        const oldPositions = new Map();
+        for (const node of Array.from(todoList.children)) {
+            if (node === this.topSpacer || node === this.bottomSpacer) {
+                continue;
+            }
+            const id = node.dataset.id;
+            if (id !== undefined && wanted.has(id)) {
+                oldPositions.set(id, oldPositions.size);
+            } else {
+                // Rows scrolled out of view or of deleted todos, kept for
+                // reuse, or the empty state
+                node.remove();
+                if (id !== undefined) {
+                    this.rowNodes.delete(id);
+                    this.spareRows.push(node);
+                }
+            }
+        }
+        
+        // Rows in the longest run that is already in order stay where they
+        // are; every other row is created or moved in front of its successor
+        const sources = todos.map(todo => oldPositions.has(todo.id) ? oldPositions.get(todo.id) : -1);
+        const stable = this.longestIncreasingRun(sources);
+        let next = this.bottomSpacer;
+        for (let i = todos.length - 1; i >= 0; i--) {
+            const todo = todos[i];
+            let node = this.rowNodes.get(todo.id);
+            if (!node) {
+                node = this.spareRows.pop() || this.createTodoElement();
+                node.dataset.id = todo.id;
+                node.classList.remove('removing');
+                node.classList.toggle('entering', this.addedIds.has(todo.id));
+                this.rowNodes.set(todo.id, node);
+            } else if (!stable.has(i)) {
+                // Moving a row restarts its animation; stop a slide-in early
+                node.classList.remove('entering');
+            }
+            this.updateTodoElement(node, todo);
+            if (!stable.has(i)) {
+                todoList.insertBefore(node, next);
+            }
+            next = node;
+        }
+    }
+    
+    longestIncreasingRun(sources) {
+        // Indices of a longest increasing subsequence of the old positions
+        // (new rows, marked -1, are never part of it)
+        const tails = [];
+        const previous = new Array(sources.length);
+        for (let i = 0; i < sources.length; i++) {
+            const value = sources[i];
+            if (value < 0) {
+                continue;
+            }
+            let low = 0;
+            let high = tails.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (sources[tails[mid]] < value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
             }
+            previous[i] = low > 0 ? tails[low - 1] : -1;
+            tails[low] = i;
+        }
+        
+        const result = new Set();
+        let i = tails.length > 0 ? tails[tails.length - 1] : -1;
+        while (i >= 0) {
+            result.add(i);
+            i = previous[i];
+        }
+        return result;
+    }
+    
+    createTodoElement() {
+        const item = document.createElement('div');
+        item.className = 'todo-item';
+        
+        const checkbox = document.createElement('input');
+        checkbox.type = 'checkbox';
+        checkbox.className = 'todo-checkbox';
+        checkbox.dataset.action = 'toggle';
+        
+        const content = document.createElement('div');
+        content.className = 'todo-content';
+        const text = document.createElement('div');
+        text.className = 'todo-text';
+        const time = document.createElement('div');
+        time.className = 'todo-time';
+        content.append(text, time);
+        
+        const deleteBtn = document.createElement('button');
+        deleteBtn.className = 'delete-btn';
+        deleteBtn.title = 'Delete todo';
+        deleteBtn.textContent = '🗑️';
+        deleteBtn.dataset.action = 'delete';
+        
+        item.append(checkbox, content, deleteBtn);
+        return item;
+    }
+    
+    updateTodoElement(node, todo) {
+        // Only touch the DOM when what the row shows has changed
+        if (node.renderedCompleted !== todo.completed) {
+            node.classList.toggle('completed', todo.completed);
+            node.querySelector('.todo-checkbox').checked = todo.completed;
+            node.renderedCompleted = todo.completed;
+        }
+        if (node.renderedText !== todo.text) {
+            const text = node.querySelector('.todo-text');
+            text.textContent = todo.text;
+            text.title = todo.text;
+            node.renderedText = todo.text;
+        }
+        if (node.renderedCreatedAt !== todo.createdAt) {
+            node.querySelector('.todo-time').textContent = this.formatDate(todo.createdAt);
+            node.renderedCreatedAt = todo.createdAt;
+        }
+    }
+    
+    getEmptyState(todoList) {
+        if (!this.emptyState) {
+            this.emptyState = todoList.querySelector('.empty-state');
+        }
+        if (!this.emptyState) {
+            this.emptyState = document.createElement('div');
+            this.emptyState.className = 'empty-state';
+            this.emptyState.innerHTML = '<p>No todos yet. Add one above!</p>';
+        }
+        return this.emptyState;
+    }
+    
+    saveTodo(todo) {
+        return this.write(storage => storage.put(todo));
+    }
+    
+    write(operation) {
+        // Writes are queued behind opening the store and never block the UI
+        return this.storage
+            .then(operation)
+            .catch(error => console.error('❌ Error saving todos:', error));
+    }
+    
+    async loadTodos() {
+        try {
+            const storage = await this.storage;
+            const saved = await storage.load();
+            // Keep todos added while the store was still loading
+            this.setTodos(saved.concat([...this.todoById.values()]));
+            console.log(`📥 Loaded ${saved.length} todos from ${storage.name}`);
         } catch (error) {
             console.error('❌ Error loading todos:', error);
-            this.todos = [];
         }
+        this.renderTodoList();
     }
     
-    generateId() {
-        return Date.now().toString(36) + Math.random().toString(36).substr(2);
+    setTodos(todos) {
+        // Replace all todos, sorting each partition once
+        this.todoById = new Map();
+        this.pending = [];
+        this.completed = [];
+        for (const todo of todos) {
+            if (this.todoById.has(todo.id)) {
+                // Already loaded (a todo added while loading may also be saved)
+                continue;
+            }
+            todo.createdAt = toTimestamp(todo.createdAt);
+            this.todoById.set(todo.id, todo);
+            this.partitionOf(todo).push(todo);
+        }
+        this.pending.sort((a, b) => a.createdAt - b.createdAt);
+        this.completed.sort((a, b) => a.createdAt - b.createdAt);
     }
     
-    escapeHtml(unsafe) {
-        return unsafe
-            .replace(/&/g, "&amp;")
-            .replace(/</g, "&lt;")
-            .replace(/>/g, "&gt;")
-            .replace(/"/g, "&quot;")
-            .replace(/'/g, "&#039;");
+    generateId() {
+        return Date.now().toString(36) + Math.random().toString(36).substr(2);
     }
     
-    formatDate(isoString) {
-        const date = new Date(isoString);
+    formatDate(timestamp) {
+        const date = new Date(timestamp);
         const now = new Date();
         const diffMs = now - date;
         const diffHours = diffMs / (1000 * 60 * 60);
@@ -786,7 +1272,7 @@ A simple and elegant todo list application built with pure HTML, CSS, and JavaSc
 ✅ **Add Todos**: Create new todo items with a simple text input  
 ✅ **Mark Complete**: Check off completed tasks  
 ✅ **Delete Todos**: Remove tasks you no longer need  
-✅ **Persistent Storage**: Data is saved in browser's localStorage  
+✅ **Persistent Storage**: Data is saved in browser's IndexedDB (localStorage as fallback)  
 ✅ **Responsive Design**: Works on desktop and mobile devices  
 ✅ **Progressive Web App**: Can be installed on devices  
 ✅ **Offline Support**: Works without internet connection  
@@ -842,7 +1328,8 @@ Works in all modern browsers including:
 ## Technical Details
 
 - **No external dependencies**: Everything runs locally
-- **LocalStorage**: Data persists between sessions
+- **IndexedDB**: Data persists between sessions, one record per todo, written asynchronously; todos from older versions are moved over from localStorage once, and localStorage is used when IndexedDB is unavailable
+- **Virtual scrolling**: Only the todos in view (plus a small buffer) are in the page, so long lists scroll smoothly
 - **Service Worker**: Enables offline functionality
 - **Responsive CSS**: Mobile-first design
 - **Vanilla JavaScript**: No frameworks required
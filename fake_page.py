@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Headless stand-in for ft.Page used by the tests and benchmarks.
+
+FakePage runs Flet's real control diffing (the same update commands a
+browser session would receive) without a client connection, and records
+what the app sends: update() calls, serialized command payload sizes,
+controls created on the client and client_storage writes.
+"""
+
+import itertools
+import json
+import threading
+from typing import Any, Callable, Dict, List
+
+import flet as ft
+from flet_core.protocol import CommandEncoder
+
+
+class FakeClientStorage:
+    """In-memory stand-in for page.client_storage that counts writes."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.write_count = 0
+        self.bytes_written = 0
+
+    def get(self, key: str):
+        return self.data.get(key)
+
+    def set(self, key: str, value: Any) -> bool:
+        self.data[key] = value
+        self.write_count += 1
+        self.bytes_written += len(json.dumps(value))
+        return True
+
+    def remove(self, key: str) -> bool:
+        self.write_count += 1
+        return self.data.pop(key, None) is not None
+
+    def contains_key(self, key: str) -> bool:
+        return key in self.data
+
+    def get_keys(self, key_prefix: str) -> List[str]:
+        return [key for key in self.data if key.startswith(key_prefix)]
+
+    async def get_async(self, key: str):
+        return self.get(key)
+
+    async def set_async(self, key: str, value: Any) -> bool:
+        return self.set(key, value)
+
+    async def remove_async(self, key: str) -> bool:
+        return self.remove(key)
+
+
+class FakePubSubHub:
+    """In-process message bus shared by FakePages, delivering synchronously."""
+
+    def __init__(self):
+        self.subscribers: Dict[str, List[tuple]] = {}
+
+    def subscribe_topic(self, session: Any, topic: str, handler: Callable):
+        self.subscribers.setdefault(topic, []).append((session, handler))
+
+    def send_others_on_topic(self, session: Any, topic: str, message: Any):
+        for other, handler in list(self.subscribers.get(topic, [])):
+            if other is not session:
+                handler(topic, message)
+
+    def unsubscribe_all(self, session: Any):
+        for topic, subscribers in self.subscribers.items():
+            subscribers[:] = [item for item in subscribers if item[0] is not session]
+
+
+class FakePubSub:
+    """page.pubsub stand-in bound to one FakePage."""
+
+    def __init__(self, hub: FakePubSubHub, session: Any):
+        self.hub = hub
+        self.session = session
+
+    def subscribe_topic(self, topic: str, handler: Callable):
+        self.hub.subscribe_topic(self.session, topic, handler)
+
+    def send_others_on_topic(self, topic: str, message: Any):
+        self.hub.send_others_on_topic(self.session, topic, message)
+
+    def unsubscribe_all(self):
+        self.hub.unsubscribe_all(self.session)
+
+
+class FakePage:
+    """Minimal ft.Page replacement that diffs controls like a connected page."""
+
+    def __init__(self, pubsub_hub: FakePubSubHub = None):
+        self.client_storage = FakeClientStorage()
+        # Pages created with the same hub see each other's messages
+        self.pubsub = FakePubSub(pubsub_hub or FakePubSubHub(), self)
+        self.overlay: List[ft.Control] = []
+        self.title = None
+        self.theme_mode = None
+        self.padding = None
+        self.on_disconnect = None
+        self.on_close = None
+
+        # Statistics
+        self.update_count = 0
+        self.payload_bytes = 0
+        self.last_payload_bytes = 0
+        self.last_updated: List[ft.Control] = []
+        self.controls_added = 0
+        self.controls_removed = 0
+
+        self._lock = threading.RLock()
+        self._uids = itertools.count()
+        self._root = ft.Column()
+        self._root._Control__uid = "page"
+        self._index: Dict[str, Any] = {"page": self}
+
+    @property
+    def controls(self) -> List[ft.Control]:
+        return self._root.controls
+
+    def add(self, *controls: ft.Control):
+        with self._lock:
+            self._root.controls.extend(controls)
+            self.update()
+
+    def update(self, *controls: ft.Control):
+        """Diff the given controls (or the whole page) and record the payload."""
+        with self._lock:
+            commands, added, removed = [], [], []
+            for control in controls or (self._root,):
+                control.build_update_commands(self._index, commands, added, removed)
+            for control in added:
+                uid = f"_{next(self._uids)}"
+                control._Control__uid = uid
+                control.page = self
+                self._index[uid] = control
+            for control in removed:
+                control.page = None
+
+            self.last_payload_bytes = len(json.dumps(commands, cls=CommandEncoder)) if commands else 0
+            self.payload_bytes += self.last_payload_bytes
+            self.last_updated = list(controls) or [self._root]
+            self.controls_added += len(added)
+            self.controls_removed += len(removed)
+            self.update_count += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of the recorded counters."""
+        return {
+            "updates": self.update_count,
+            "payload_bytes": self.payload_bytes,
+            "controls_added": self.controls_added,
+            "storage_writes": self.client_storage.write_count,
+            "storage_bytes": self.client_storage.bytes_written,
+        }
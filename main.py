@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """
 Main entry point for the Flet Todo List Application.
+
+Pass --async to run the async app variant.
 """
 
+import sys
+
 from todo_app import main
+from todo_app_async import main_async
 import flet as ft
 
 if __name__ == "__main__":
-    ft.app(target=main, view=ft.WEB_BROWSER)
\ No newline at end of file
+    target = main_async if "--async" in sys.argv[1:] else main
+    ft.app(target=target, view=ft.WEB_BROWSER)
\ No newline at end of file
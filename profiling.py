@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Opt-in latency instrumentation and profiling for the Flet Todo List Application.
+
+When installed, every TodoApp event handler, persistence call and
+page.update() is timed. The last samples of each call are kept in a rolling
+histogram, and cProfile statistics and tracemalloc snapshots can be dumped
+on demand (SIGUSR1 where available, or Instrumentation.dump()).
+
+Enable it with ``python run.py --profile`` or ``FLETTODO_PROFILE=1``.
+"""
+
+import cProfile
+import os
+import pstats
+import signal
+import threading
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import flet as ft
+
+from todo_app import TodoApp
+from todo_storage import ClientStorageJournal, SQLiteBackend
+
+# (class, method) pairs that are timed, labelled "Class.method"
+INSTRUMENTED_METHODS = [
+    (TodoApp, "add_todo"),
+    (TodoApp, "toggle_todo_completed"),
+    (TodoApp, "delete_todo"),
+    (TodoApp, "import_todos_from_file"),
+    (TodoApp, "export_todos_to_file"),
+    (TodoApp, "save_todos"),
+    (TodoApp, "load_todos"),
+    (TodoApp, "record_changes"),
+    (TodoApp, "update_todo_list"),
+    (ClientStorageJournal, "apply"),
+    (ClientStorageJournal, "write_snapshot"),
+    (ClientStorageJournal, "load"),
+    (SQLiteBackend, "apply"),
+    (SQLiteBackend, "write_snapshot"),
+    (SQLiteBackend, "load"),
+    (ft.Page, "update"),
+]
+
+
+class RollingHistogram:
+    """Call count, total time and the durations of the most recent calls."""
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, duration: float):
+        self.samples.append(duration)
+        self.count += 1
+        self.total += duration
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Instrumentation:
+    """Times instrumented methods and collects profiles while installed."""
+
+    def __init__(self, window: int = 1000, cprofile: bool = False,
+                 trace_memory: bool = False, dump_dir: str = "."):
+        self.window = window
+        self.dump_dir = dump_dir
+        self.trace_memory = trace_memory
+        self.histograms: Dict[str, RollingHistogram] = {}
+        self.cprofile = cprofile
+        self._lock = threading.Lock()
+        # One profiler for the process: since Python 3.12 only one can be
+        # active at a time. It profiles one outermost call at a time; calls
+        # overlapping it on other threads are only timed. No lock is held
+        # while a call runs, since page.update (instrumented too) takes the
+        # UI lock and a shared lock would be taken in the opposite order.
+        self.profiler = cProfile.Profile()
+        self._profiling = False
+        self._local = threading.local()
+        self._originals: List[tuple] = []
+
+    def install(self):
+        """Wrap all instrumented methods."""
+        for cls, name in INSTRUMENTED_METHODS:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self.timed(f"{cls.__name__}.{name}", original))
+        if self.trace_memory:
+            tracemalloc.start()
+
+    def uninstall(self):
+        """Restore the original methods."""
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+        if self.trace_memory:
+            tracemalloc.stop()
+
+    def install_signal_handler(self):
+        """Dump statistics whenever the process receives SIGUSR1."""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump())
+
+    def timed(self, label: str, func: Callable) -> Callable:
+        """Return a wrapper of func that records its duration under label."""
+        def wrapper(*args, **kwargs):
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            start = time.perf_counter()
+            try:
+                if depth == 0 and self.start_profiling():
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        self.stop_profiling()
+                return func(*args, **kwargs)
+            finally:
+                self.record(label, time.perf_counter() - start)
+                self._local.depth = depth
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def start_profiling(self) -> bool:
+        """Enable the profiler unless a call is already being profiled.
+
+        Returns whether it was enabled; another profiling tool being
+        active (Python 3.12+) just leaves the call unprofiled.
+        """
+        if not self.cprofile:
+            return False
+        with self._lock:
+            if self._profiling:
+                return False
+            self._profiling = True
+        try:
+            self.profiler.enable()
+        except ValueError:
+            self._profiling = False
+            return False
+        return True
+
+    def stop_profiling(self):
+        self.profiler.disable()
+        with self._lock:
+            self._profiling = False
+
+    def record(self, label: str, duration: float):
+        with self._lock:
+            histogram = self.histograms.get(label)
+            if histogram is None:
+                histogram = self.histograms[label] = RollingHistogram(self.window)
+            histogram.add(duration)
+
+    def report(self) -> str:
+        """Table of call counts and latency percentiles in milliseconds."""
+        lines = [
+            f"{'call':<40} {'count':>7} {'total':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"
+        ]
+        with self._lock:
+            histograms = sorted(self.histograms.items(), key=lambda item: -item[1].total)
+            for label, h in histograms:
+                lines.append(
+                    f"{label:<40} {h.count:>7} {h.total * 1000:>9.1f} "
+                    f"{h.percentile(50) * 1000:>8.2f} {h.percentile(90) * 1000:>8.2f} "
+                    f"{h.percentile(99) * 1000:>8.2f} {max(h.samples, default=0) * 1000:>8.2f}"
+                )
+        return "\n".join(lines)
+
+    def profile_stats(self, timeout: float = 1.0) -> Optional[pstats.Stats]:
+        """cProfile statistics so far, or None if nothing was profiled.
+
+        Waits up to timeout seconds for a profiled call to finish (none
+        will if dump() interrupts one on the same thread).
+        """
+        if not self.cprofile:
+            return None
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._profiling:
+                    # Claim the profiler so no call enables it meanwhile
+                    self._profiling = True
+                    break
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+        try:
+            self.profiler.create_stats()
+            if not self.profiler.stats:
+                return None
+            return pstats.Stats(self.profiler)
+        finally:
+            with self._lock:
+                self._profiling = False
+
+    def dump(self) -> List[str]:
+        """Write the latency report and any cProfile/tracemalloc data to dump_dir."""
+        os.makedirs(self.dump_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.dump_dir, f"flettodo-{stamp}")
+        paths = []
+
+        with open(f"{base}-latency.txt", "w", encoding="utf-8") as f:
+            f.write(self.report() + "\n")
+        paths.append(f"{base}-latency.txt")
+
+        stats = self.profile_stats()
+        if stats is not None:
+            stats.dump_stats(f"{base}.prof")
+            with open(f"{base}-profile.txt", "w", encoding="utf-8") as f:
+                stats.stream = f
+                stats.sort_stats("cumulative").print_stats(40)
+            paths += [f"{base}.prof", f"{base}-profile.txt"]
+
+        if self.trace_memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            snapshot.dump(f"{base}.tracemalloc")
+            with open(f"{base}-memory.txt", "w", encoding="utf-8") as f:
+                for stat in snapshot.statistics("lineno")[:40]:
+                    f.write(f"{stat}\n")
+            paths += [f"{base}.tracemalloc", f"{base}-memory.txt"]
+
+        print(f"📊 Profiling data written: {', '.join(paths)}")
+        return paths
@@ -4,24 +4,83 @@ Simple runner script for the FleTodo application.
 This is the most convenient way to start the todo app.
 """
 
+import argparse
+import atexit
+import functools
 import sys
 import os
 
 # Add current directory to path so we can import our modules
 sys.path.insert(0, os.path.dirname(__file__))
 
+parser = argparse.ArgumentParser(description="Run the FleTodo application")
+parser.add_argument(
+    "--db",
+    metavar="PATH",
+    help="store todos in this SQLite database instead of browser localStorage"
+)
+parser.add_argument(
+    "--async",
+    dest="use_async",
+    action="store_true",
+    help="run the async app variant (handlers run on Flet's event loop)"
+)
+parser.add_argument(
+    "--shared",
+    action="store_true",
+    help="let all browser sessions share one todo list stored on the server "
+         "(in the --db database, todos.db by default)"
+)
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    default=os.environ.get("FLETTODO_PROFILE", "").strip().lower() in ("1", "true", "yes", "on"),
+    help="time handlers and persistence calls and collect cProfile/tracemalloc data "
+         "(also enabled by FLETTODO_PROFILE=1)"
+)
+parser.add_argument(
+    "--profile-dir",
+    metavar="DIR",
+    default="profiles",
+    help="directory for profiling dumps (default: profiles)"
+)
+args = parser.parse_args()
+if args.shared and args.use_async:
+    parser.error("--shared cannot be combined with --async")
+
 try:
     import flet as ft
     from todo_app import main
+    from todo_app_async import main_async
+    from todo_app_shared import shared_target
     
     print("🚀 Starting FleTodo - Flet Todo List Application...")
     print("💡 This will open in your web browser")
     print("📝 Features: Add todos, mark complete, delete, persistent storage")
     print("🔗 The app will be available at a local web address")
+    if args.shared:
+        args.db = args.db or "todos.db"
+        print(f"👥 All sessions share one todo list stored in {args.db}")
+    elif args.db:
+        print(f"🗄️  Storing todos in SQLite database: {args.db}")
+    if args.use_async:
+        print("⚡ Running the async app variant")
+    if args.profile:
+        from profiling import Instrumentation
+        
+        instrumentation = Instrumentation(cprofile=True, trace_memory=True, dump_dir=args.profile_dir)
+        instrumentation.install()
+        instrumentation.install_signal_handler()
+        atexit.register(instrumentation.dump)
+        print(f"⏱️  Profiling enabled: send SIGUSR1 (kill -USR1 {os.getpid()}) to dump to {args.profile_dir}/")
     print("")
     
     # Run the application
-    ft.app(target=main, view=ft.WEB_BROWSER)
+    if args.shared:
+        target = shared_target(args.db)
+    else:
+        target = functools.partial(main_async if args.use_async else main, db_path=args.db)
+    ft.app(target=target, view=ft.WEB_BROWSER)
     
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -3,10 +3,26 @@
 Simple test script for TodoItem functionality.
 """
 
-from todo_app import TodoItem
+from todo_app import TodoItem, TodoApp
+from fake_page import FakePage, FakePubSubHub
+from todo_store import TodoStore, new_todo_id
+from todo_storage import ClientStorageJournal, SQLiteBackend, put_record
+from todo_io import iter_json_array
+from timer_scheduler import TimerScheduler
+from todo_app_async import AsyncTodoApp
+from todo_app_shared import SharedTodoApp, SharedTodoStore
+import asyncio
+import io
 import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
 from datetime import datetime
 
+
 def test_todo_item():
     """Test TodoItem creation and serialization."""
     print("Testing TodoItem functionality...")
@@ -32,6 +48,37 @@ def test_todo_item():
     
     print("✅ All TodoItem tests passed!")
 
+def test_todo_item_timestamps():
+    """Test that TodoItem stores a numeric timestamp and caches its display string."""
+    print("\nTesting TodoItem timestamps...")
+    
+    todo = TodoItem("Slotted", creation_time="2025-09-26T09:21:21.939687")
+    assert not hasattr(todo, "__dict__")
+    assert isinstance(todo.created_at, float)
+    assert todo.creation_time == "2025-09-26T09:21:21.939687"
+    assert TodoItem.from_dict(todo.to_dict()).created_at == todo.created_at
+    assert todo.display_time == "09/26/2025 09:21"
+    assert todo.display_time is todo.display_time
+    print(f"Display time: {todo.display_time}")
+    
+    print("✅ TodoItem timestamp tests passed!")
+
+def test_todo_ids():
+    """Test that generated ids are unique and sort in creation order."""
+    print("\nTesting TodoItem ids...")
+    
+    ids = [new_todo_id() for _ in range(10000)]
+    assert len(set(ids)) == len(ids)
+    assert sorted(ids) == ids
+    assert all(len(todo_id) == 26 for todo_id in ids)
+    
+    # Ids follow the creation time, even for todos created out of order
+    old = TodoItem("Old", creation_time="2020-01-01T00:00:00")
+    assert old.id < ids[0]
+    print(f"Example id: {ids[0]}")
+    
+    print("✅ TodoItem id tests passed!")
+
 def test_json_serialization():
     """Test JSON serialization of multiple todos."""
     print("\nTesting JSON serialization...")
@@ -59,7 +106,813 @@ def test_json_serialization():
     
     print("✅ JSON serialization tests passed!")
 
+def test_update_todo_list_reuses_rows():
+    """Test that list updates only create rows for new todos."""
+    print("\nTesting incremental todo list updates...")
+    
+    app = TodoApp(FakePage())
+    for name in ["First", "Second", "Third"]:
+        app.todo_input.value = name
+        app.add_todo()
+    rows = dict(app.todo_rows)
+    
+    # Toggling keeps the row object and moves it behind the pending ones
+    first = app.todos[0]
+    app.toggle_todo_completed(first.id)
+    assert app.todo_rows[first.id] is rows[first.id]
+    assert app.todo_list.controls[-1] is rows[first.id]
+    assert rows[first.id].content.controls[0].value is True
+    
+    # Deleting drops only the deleted row
+    second = app.todos[1]
+    app.delete_todo(second.id)
+    assert second.id not in app.todo_rows
+    assert all(app.todo_rows[t.id] is rows[t.id] for t in app.todos)
+    print(f"Rendered rows after toggle and delete: {len(app.todo_list.controls)}")
+    
+    print("✅ Incremental update tests passed!")
+
+def test_todo_store_order():
+    """Test TodoStore lookups and display order."""
+    print("\nTesting TodoStore...")
+    
+    store = TodoStore([
+        TodoItem("Old", creation_time="2024-01-01T09:00:00", todo_id="a"),
+        TodoItem("Done", creation_time="2024-01-01T08:00:00", completed=True, todo_id="b"),
+        TodoItem("New", creation_time="2024-01-02T09:00:00", todo_id="c"),
+    ])
+    assert [t.id for t in store] == ["a", "c", "b"]
+    assert store.get("c").name == "New"
+    
+    # Completing a todo moves it into the completed partition
+    todo, old_index, new_index = store.toggle("a")
+    assert (old_index, new_index) == (0, 2)
+    assert [t.id for t in store] == ["c", "b", "a"]
+    assert store.index_of("a") == 2
+    
+    # Adding returns the display position
+    assert store.add(TodoItem("Middle", creation_time="2024-01-01T12:00:00", todo_id="d")) == 0
+    _, index = store.remove("b")
+    assert index == 2
+    assert (store.pending_count, store.completed_count) == (2, 1)
+    print(f"Store order: {[t.name for t in store]}")
+    
+    print("✅ TodoStore tests passed!")
+
+def test_todo_list_render_window():
+    """Test that only a window of rows is materialized."""
+    print("\nTesting paged todo list rendering...")
+    
+    app = TodoApp(FakePage(), page_size=2)
+    for name in ["First", "Second", "Third", "Fourth"]:
+        app.todo_input.value = name
+        app.add_todo()
+    assert len(app.todo_list.controls) == 2
+    
+    # Deleting a rendered todo pulls the next one into the window
+    first, second, third, _ = app.todos
+    app.delete_todo(first.id)
+    assert [row.key for row in app.todo_list.controls] == [second.id, third.id]
+    
+    # Completing a todo moves it out of the window
+    app.toggle_todo_completed(second.id)
+    assert second.id not in app.todo_rows
+    assert len(app.todo_list.controls) == 2
+    
+    app.show_more_todos()
+    assert [row.key for row in app.todo_list.controls] == [t.id for t in app.todos]
+    print(f"Rendered {len(app.todo_list.controls)} of {len(app.store)} todos")
+    
+    # Scrolling far down slides a bounded window instead of growing it
+    app.add_todos([f"Bulk {i}" for i in range(30)])
+    window = app.page_size * app.RENDER_WINDOW_PAGES
+    dropped = sum(app.show_more_todos() for _ in range(20))
+    rendered = lambda: [row.key for row in app.todo_list.controls]
+    assert len(app.todo_rows) == window and dropped == app.render_start == len(app.store) - window
+    assert rendered() == [t.id for t in app.todos[app.render_start:]]
+    
+    # Changes before and inside the window keep it in step with the list
+    app.delete_todo(app.todos[0].id)
+    app.toggle_todo_completed(app.todos[app.render_start + 1].id)
+    app.todo_input.value = "Late"
+    app.add_todo()
+    assert rendered() == [t.id for t in app.todos[app.render_start:app.render_start + window]]
+    
+    # Scrolling near the top slides it back and keeps the rows in view in place
+    app.todo_list.scroll_to = lambda offset: setattr(app, "scrolled_to", offset)
+    start = app.render_start
+    app.on_todo_list_scroll(SimpleNamespace(pixels=100.0, max_scroll_extent=500.0, viewport_dimension=100.0))
+    assert app.render_start == start - app.page_size and app.scrolled_to == 100.0 + 2 * 60.0
+    assert rendered() == [t.id for t in app.todos[app.render_start:app.render_start + window]]
+    while app.show_earlier_todos():
+        pass
+    assert rendered() == [t.id for t in app.todos[:window]]
+    
+    print("✅ Paged rendering tests passed!")
+
+def test_journaled_persistence():
+    """Test that changes are journaled and replayed on load."""
+    print("\nTesting journaled persistence...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    for name in ["Keep", "Finish", "Drop"]:
+        app.todo_input.value = name
+        app.add_todo()
+    keep, finish, drop = app.todos
+    app.toggle_todo_completed(finish.id)
+    app.delete_todo(drop.id)
+    
+    # Each change is a small journal entry, the snapshot is never rewritten
+    assert page.client_storage.get("todos") is None
+    assert page.client_storage.get("todos.journal") == 5
+    
+    reloaded = TodoApp(page, save_delay=0)
+    assert [(t.name, t.completed) for t in reloaded.todos] == [("Keep", False), ("Finish", True)]
+    
+    # Compaction folds the journal into the snapshot
+    reloaded.save_todos()
+    assert page.client_storage.get("todos.journal") == 0
+    assert "todos.journal.0" not in page.client_storage.data
+    assert len(TodoApp(page).todos) == 2
+    print(f"Storage keys after compaction: {sorted(page.client_storage.data)}")
+    
+    # The journal stays short however many changes a large list gets
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    app.add_todos([f"Task {i}" for i in range(500)])
+    for todo in app.todos[:499]:
+        app.toggle_todo_completed(todo.id)
+    assert page.client_storage.get("todos.journal") < ClientStorageJournal.MAX_JOURNAL_ENTRIES
+    assert sum(t.completed for t in TodoApp(page).todos) == 499
+    
+    print("✅ Journaled persistence tests passed!")
+
+def test_debounced_saving():
+    """Test that a burst of changes is written as one journal entry."""
+    print("\nTesting debounced saving...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=60)
+    for i in range(10):
+        app.todo_input.value = f"Todo {i}"
+        app.add_todo()
+    app.toggle_todo_completed(app.todos[0].id)
+    assert app.saver.dirty
+    assert page.client_storage.get("todos.journal") is None
+    
+    app.flush_saves()
+    assert not app.saver.dirty
+    assert (app.saver.requested, app.saver.performed) == (11, 1)
+    assert page.client_storage.get("todos.journal") == 1
+    entry = json.loads(page.client_storage.get("todos.journal.0"))
+    print(f"Coalesced {len(entry)} changes into one write")
+    assert len(entry) == 11
+    assert len(TodoApp(page).todos) == 10
+    
+    # A failed write keeps the changes buffered for the next attempt
+    set_item = page.client_storage.set
+    def fail_once(key, value):
+        page.client_storage.set = set_item
+        raise TimeoutError("client did not respond")
+    page.client_storage.set = fail_once
+    app.delete_todo(app.todos[0].id)
+    app.flush_saves()
+    assert app.saver.dirty
+    assert (app.saver.failed, app.saver.retried) == (1, 1)
+    app.flush_saves()
+    assert not app.saver.dirty
+    assert (app.saver.requested, app.saver.performed) == (12, 2)
+    assert len(TodoApp(page).todos) == 9
+    
+    # Flushing with nothing buffered writes nothing
+    app.flush_saves()
+    assert app.saver.performed == 2
+    
+    print("✅ Debounced saving tests passed!")
+
+def test_sqlite_backend():
+    """Test that the SQLite backend stores one row per todo."""
+    print("\nTesting SQLite storage backend...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "todos.db")
+        page = FakePage()
+        app = TodoApp(page, save_delay=60, storage=SQLiteBackend(path))
+        for name in ["Alpha", "Beta", "Gamma"]:
+            app.todo_input.value = name
+            app.add_todo()
+        alpha, beta, gamma = app.todos
+        app.toggle_todo_completed(alpha.id)
+        app.delete_todo(beta.id)
+        
+        # Ending the session writes pending changes and closes the connection
+        page.on_close(None)
+        try:
+            app.storage.count()
+            assert False, "connection was left open"
+        except sqlite3.ProgrammingError:
+            pass
+        
+        storage = SQLiteBackend(path)
+        assert storage.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert storage.count() == 2
+        assert [t.name for t in storage.load_page(None, 1)] == ["Gamma"]
+        assert [[t.name for t in page] for page in storage.iter_pages(1)] == [["Gamma"], ["Alpha"]]
+        # Todos created at the same time are neither skipped nor repeated
+        storage.apply([put_record(TodoItem(f"Tie {i}", creation_time=gamma.creation_time)) for i in range(3)])
+        paged = [todo.id for page in storage.iter_pages(2) for todo in page]
+        assert len(paged) == len(set(paged)) == 5
+        storage.apply([{"op": "delete", "id": todo_id} for todo_id in paged if todo_id not in (alpha.id, gamma.id)])
+        reloaded = TodoApp(FakePage(), storage=storage)
+        assert [(t.name, t.completed) for t in reloaded.todos] == [("Gamma", False), ("Alpha", True)]
+        storage.close()
+    print("Reloaded todos from SQLite")
+    
+    print("✅ SQLite backend tests passed!")
+
+def test_streaming_import():
+    """Test parsing and importing an export file incrementally."""
+    print("\nTesting streaming import...")
+    
+    data = [{"n": i, "text": "ü" * (i % 7)} for i in range(50)] + [123456, "x"]
+    raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    parsed = [element for element, _ in iter_json_array(io.BytesIO(raw), chunk_size=7)]
+    assert parsed == data
+    
+    # Tokens cut off at any chunk boundary are completed by reading on
+    data = [{"n": -12.5e-3, "t": True, "z": None, "s": "\u00e9\"\n" + "x" * i} for i in range(20)] + [123456789]
+    raw = json.dumps(data).encode("utf-8")
+    for chunk_size in range(1, 24):
+        assert [element for element, _ in iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)] == data
+    
+    # A malformed element fails at once instead of pulling in the rest of the file
+    raw = json.dumps([{"id": str(i), "name": "x" * 50} for i in range(5000)]).encode("utf-8")
+    f = io.BytesIO(raw.replace(b":", b";", 3))
+    try:
+        list(iter_json_array(f, chunk_size=4096))
+        assert False, "malformed element was accepted"
+    except ValueError:
+        assert f.tell() == 4096
+    
+    # Nothing but whitespace may follow the list, even an empty one
+    for raw in [b"[]", b" [ ]\n", b"[\n]\n\n"]:
+        for chunk_size in (1, 3, 4096):
+            assert list(iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)) == []
+    for raw in [b'[]{"id": "1"}]', b"[\n]{}\n]", b"[] null, 1]", b"[1] x"]:
+        for chunk_size in (1, 3, 4096):
+            try:
+                list(iter_json_array(io.BytesIO(raw), chunk_size=chunk_size))
+                assert False, f"trailing data after {raw!r} was accepted"
+            except ValueError:
+                pass
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "todos.json")
+        todos = [TodoItem(f"Imported {i}", completed=(i % 2 == 0)) for i in range(2500)]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([todo.to_dict() for todo in todos], f, indent=2)
+        
+        app = TodoApp(FakePage(), save_delay=0)
+        app.import_todos_from_file(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert len(app.store) == 2500
+        assert app.store.pending_count == 1250
+        assert app.todos[0].name == "Imported 1"
+        
+        # A broken file leaves the current todos untouched
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('[{"id": "1", "name": "a", "creation_time": "", "completed": false}, {"id": ')
+        app.import_todos_from_file(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert len(app.store) == 2500
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('[]{"id": "1", "name": "a", "creation_time": "", "completed": false}]')
+        app.import_todos_from_file(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert len(app.store) == 2500
+        print(f"Status after broken import: {app.status_message.value}")
+    
+    print("✅ Streaming import tests passed!")
+
+def test_streaming_export():
+    """Test that exports are streamed to the file by a worker thread."""
+    print("\nTesting streaming export...")
+    
+    app = TodoApp(FakePage(), save_delay=0)
+    app.store.replace(TodoItem(f"Export {i}", completed=(i % 3 == 0)) for i in range(3000))
+    expected = [todo.to_dict() for todo in app.store]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "todos.json")
+        app.export_todos_to_file(SimpleNamespace(path=path)).join()
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == json.dumps(expected, indent=2, ensure_ascii=False)
+        
+        app.compact_export.value = True
+        app.export_todos_to_file(SimpleNamespace(path=path)).join()
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        assert "\n" not in content and json.loads(content) == expected
+        print(f"Compact export size: {len(content)} characters")
+    
+    print("✅ Streaming export tests passed!")
+
+def test_instrumentation():
+    """Test that instrumented handlers are timed and can be dumped."""
+    print("\nTesting instrumentation...")
+    from profiling import Instrumentation
+    
+    instrumentation = Instrumentation(cprofile=True)
+    instrumentation.install()
+    try:
+        app = TodoApp(FakePage(), save_delay=0)
+        for name in ["Profile me", "And me"]:
+            app.todo_input.value = name
+            app.add_todo()
+        app.toggle_todo_completed(app.todos[0].id)
+    finally:
+        instrumentation.uninstall()
+    
+    assert instrumentation.histograms["TodoApp.add_todo"].count == 2
+    assert instrumentation.histograms["TodoApp.load_todos"].count == 1
+    assert instrumentation.histograms["ClientStorageJournal.apply"].count >= 3
+    assert not hasattr(TodoApp.add_todo, "__wrapped__")
+    print(instrumentation.report())
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        instrumentation.dump_dir = tmp
+        paths = instrumentation.dump()
+        assert any(path.endswith(".prof") for path in paths)
+    
+    # Profiled handlers and page updates from other threads (timers holding
+    # the UI lock) must not wait on each other
+    instrumentation = Instrumentation(cprofile=True)
+    instrumentation.install()
+    FakePage.update = instrumentation.timed("FakePage.update", FakePage.update)
+    try:
+        app = TodoApp(FakePage(), save_delay=60)
+        app.add_todos([f"Todo {i}" for i in range(20)])
+        
+        def toggle():
+            for _ in range(200):
+                app.toggle_todo_completed(app.todos[0].id)
+        
+        def clear():
+            for _ in range(200):
+                app.clear_status_message()
+        
+        threads = [threading.Thread(target=toggle), threading.Thread(target=clear)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        assert not any(thread.is_alive() for thread in threads)
+        assert instrumentation.histograms["TodoApp.toggle_todo_completed"].count == 200
+        assert instrumentation.profile_stats().total_calls > 0
+        
+        # Another profiling tool being active (Python 3.12+) only skips cProfile
+        def enable():
+            raise ValueError("Another profiling tool is already active")
+        instrumentation.profiler.enable = enable
+        app.todo_input.value = "Unprofiled"
+        app.add_todo()
+        assert "Unprofiled" in [todo.name for todo in app.todos]
+        assert instrumentation.histograms["TodoApp.add_todo"].count == 1
+        assert not instrumentation.start_profiling()
+    finally:
+        FakePage.update = FakePage.update.__wrapped__
+        instrumentation.uninstall()
+    
+    print("✅ Instrumentation tests passed!")
+
+def test_targeted_updates():
+    """Test that handlers only send the controls they changed."""
+    print("\nTesting targeted control updates...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    for name in ["One", "Two", "Three"]:
+        app.todo_input.value = name
+        app.add_todo()
+    assert set(page.last_updated) == {app.todo_list, app.todo_input}
+    
+    # Completing the last pending todo keeps its position: only its row is sent
+    updates = page.update_count
+    last = app.todos[-1]
+    app.toggle_todo_completed(last.id)
+    assert page.update_count == updates + 1
+    assert page.last_updated == [app.todo_rows[last.id]]
+    print(f"Toggle payload: {page.last_payload_bytes} bytes")
+    
+    app.show_status_message("Hello")
+    assert page.last_updated == [app.status_message]
+    
+    # Rows are isolated, so a restyled row is sent along with the list
+    row = app.todo_rows[app.todos[0].id]
+    app.todos[0].name = "Renamed"
+    with app.ui.batch():
+        app.update_todo_list()
+    assert set(page.last_updated) == {app.todo_list, row}
+    
+    # Nested batches flush once
+    updates = page.update_count
+    with app.ui.batch():
+        app.toggle_todo_completed(app.todos[0].id)
+        app.delete_todo(app.todos[1].id)
+    assert page.update_count == updates + 1
+    
+    # A double-click runs two handlers on different threads for the same todo
+    app.add_todos([f"Todo {i}" for i in range(200)])
+    ids = [todo.id for todo in app.todos]
+    errors = []
+    
+    def delete_all():
+        try:
+            for todo_id in ids:
+                app.delete_todo(todo_id)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=delete_all) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(app.todos) == 0
+    
+    print("✅ Targeted update tests passed!")
+
+def test_timer_scheduler():
+    """Test that delayed work runs on one thread and keyed timers are replaced."""
+    print("\nTesting timer scheduler...")
+    
+    timers = TimerScheduler()
+    ran = []
+    timers.call_later(0.05, lambda: ran.append("late"))
+    timers.call_later(0.01, lambda: ran.append("early"))
+    timers.call_later(0.01, lambda: ran.append("superseded"), key="k")
+    timers.call_later(0.02, lambda: ran.append("replacement"), key="k")
+    time.sleep(0.2)
+    assert ran == ["early", "replacement", "late"]
+    
+    # A burst of status messages leaves a single pending clear and no new threads
+    app = TodoApp(FakePage(), save_delay=0, timers=timers)
+    threads = threading.active_count()
+    for i in range(200):
+        app.show_status_message(f"Message {i}")
+    assert threading.active_count() == threads
+    assert timers.pending == 1
+    
+    app.STATUS_MESSAGE_DURATION = 0
+    app.show_status_message("Gone soon")
+    time.sleep(0.1)
+    assert app.status_message.value == ""
+    print(f"Threads after 200 messages: {threading.active_count()}")
+    
+    # A save waiting on a slow client runs off the timer thread, so other
+    # sessions' timers keep firing
+    page = FakePage()
+    app = TodoApp(page, save_delay=0.01, timers=timers)
+    unblock = threading.Event()
+    set_item = page.client_storage.set
+    def slow_set(key, value):
+        unblock.wait(5)
+        set_item(key, value)
+    page.client_storage.set = slow_set
+    app.add_todos(["Slow"])
+    fired = threading.Event()
+    time.sleep(0.05)
+    timers.call_later(0, fired.set)
+    assert fired.wait(1)
+    unblock.set()
+    
+    print("✅ Timer scheduler tests passed!")
+
+def test_async_app():
+    """Test the async app variant end to end."""
+    print("\nTesting async app...")
+    
+    async def scenario(tmp):
+        page = FakePage()
+        seeded = TodoApp(page, save_delay=0)
+        seeded.todo_input.value = "Stored todo"
+        seeded.add_todo()
+        
+        # Reopen the same client storage with the async app
+        app = AsyncTodoApp(page, save_delay=60, timers=TimerScheduler())
+        await app.start()
+        assert [todo.name for todo in app.todos] == ["Stored todo"]
+        
+        app.todo_input.value = "Async todo"
+        await app.add_todo()
+        row = app.todo_rows[app.todos[0].id]
+        checkbox, _, delete_button = row.content.controls
+        await app.on_checkbox_change(SimpleNamespace(control=checkbox))
+        assert app.store.get(checkbox.data).completed
+        assert app.saver.dirty
+        await app.flush_saves()
+        assert not app.saver.dirty
+        
+        path = os.path.join(tmp, "todos.json")
+        app.current_operation = "export"
+        await app.file_picker_result(SimpleNamespace(path=path))
+        app.current_operation = "import"
+        await app.file_picker_result(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert len(app.store) == 2
+        
+        await app.on_delete_click(SimpleNamespace(control=delete_button))
+        assert len(app.store) == 1
+        
+        # Merges are matched on a worker thread and applied on the loop
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([TodoItem("Merged todo").to_dict()], f)
+        app.current_operation = "merge"
+        await app.file_picker_result(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert sorted(todo.name for todo in app.store) == ["Async todo", "Merged todo"]
+        return app
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        app = asyncio.run(scenario(tmp))
+    print(f"Todos after async session: {[todo.name for todo in app.todos]}")
+    
+    try:
+        AsyncTodoApp(FakePage(), save_delay=0)
+        assert False, "save_delay=0 must be rejected"
+    except ValueError:
+        pass
+    
+    print("✅ Async app tests passed!")
+
+def test_shared_sessions():
+    """Test sessions sharing one store and exchanging change deltas."""
+    print("\nTesting shared sessions...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = SQLiteBackend(os.path.join(tmp, "todos.db"))
+        backend.write_snapshot([TodoItem(f"Todo {i}", todo_id=f"todo-{i:02d}") for i in range(10)])
+        shared = SharedTodoStore(backend, save_delay=0)
+        hub = FakePubSubHub()
+        first_page, second_page = FakePage(hub), FakePage(hub)
+        first = SharedTodoApp(first_page, shared, page_size=5)
+        second = SharedTodoApp(second_page, shared, page_size=5)
+        assert first.store is second.store and len(first.store) == 10
+        
+        # An add in one session shows up in the other
+        first.todo_input.value = "From first"
+        first.add_todo()
+        assert [todo.name for todo in second.todos] == [todo.name for todo in first.todos]
+        new_id = first.todos[-1].id
+        
+        # Changes to rendered rows are reconciled by id in the other session
+        second.toggle_todo_completed("todo-00")
+        assert first.todo_rows["todo-01"] is first.todo_list.controls[0]
+        assert first.store.get("todo-00").completed
+        
+        # Changes past a full render window leave the other session alone
+        updates = first_page.update_count
+        second.delete_todo(new_id)
+        assert first_page.update_count == updates
+        assert new_id not in first.store
+        
+        # An import replaces the shared list in every session
+        path = os.path.join(tmp, "import.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([TodoItem("Imported").to_dict()], f)
+        first.import_todos_from_file(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+        assert shared.store is first.store is second.store
+        assert [row.key for row in second.todo_list.controls] == [first.todos[0].id]
+        
+        # All sessions persist through the same backend
+        assert [todo.name for todo in backend.load()] == ["Imported"]
+        backend.close()
+    print(f"Deltas kept the second session at {len(second.todo_rows)} rendered rows")
+    
+    print("✅ Shared session tests passed!")
+
+def test_bulk_operations():
+    """Test selection and bulk operations as single transactions."""
+    print("\nTesting bulk operations...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    app.store.replace(TodoItem(f"Todo {i}", todo_id=f"todo-{i:05d}", completed=(i % 2 == 0)) for i in range(6000))
+    app.save_todos()
+    app.update_todo_list()
+    
+    # Clearing thousands of completed todos is one write and one update
+    writes, updates = page.client_storage.write_count, page.update_count
+    assert app.clear_completed() == 3000
+    assert len(app.store) == 3000 and app.store.completed_count == 0
+    assert page.client_storage.write_count - writes == 2  # journal entry + length
+    assert page.update_count - updates == 1
+    
+    app.select_range(0, 10)
+    assert len(app.selected) == 10
+    row = app.todo_rows[app.todos[0].id]
+    assert row.data[2] and "10 selected" in app.selection_text.value
+    updates = page.update_count
+    assert app.complete_selected() == 10
+    assert page.update_count - updates == 1
+    assert app.store.completed_count == 10 and app.todos[-1].completed
+    assert app.uncomplete_selected() == 10
+    assert app.store.completed_count == 0
+    
+    app.on_row_click(SimpleNamespace(control=app.todo_rows["todo-00001"]))
+    assert "todo-00001" not in app.selected
+    app.on_row_long_press(SimpleNamespace(control=app.todo_rows["todo-00041"]))
+    assert len(app.selected) == 21  # todos 1, 3, ..., 41
+    
+    app.select_all()
+    updates = page.update_count
+    assert app.delete_selected() == 3000
+    assert page.update_count - updates == 1
+    assert not app.store and not app.selected
+    assert app.todo_list.controls == [app.empty_message]
+    
+    # The journal replays to the same state
+    assert ClientStorageJournal(page.client_storage).load() == []
+    print(f"Storage writes for the whole session: {page.client_storage.write_count - writes}")
+    
+    print("✅ Bulk operation tests passed!")
+
+def test_multiline_paste():
+    """Test that pasting several lines adds all todos in one batch."""
+    print("\nTesting multi-line paste...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    app.todo_input.value = "Buy milk\n\n  Call Bob  \r\nWrite report\n"
+    writes, updates = page.client_storage.write_count, page.update_count
+    app.add_todo()
+    assert [todo.name for todo in app.todos] == ["Buy milk", "Call Bob", "Write report"]
+    assert app.todo_input.value == ""
+    assert page.client_storage.write_count - writes == 2  # journal entry + length
+    assert page.update_count - updates == 1
+    
+    # Very large pastes are capped and report their progress
+    app.MAX_PASTE_LINES = 25
+    app.PASTE_PROGRESS_BATCH = 10
+    app.todo_input.value = "\n".join(f"Line {i}" for i in range(30))
+    app.add_todo()
+    assert len(app.store) == 28
+    assert app.todos[-1].name == "Line 24"
+    print(f"Status after capped paste: {app.status_message.value}")
+    
+    print("✅ Multi-line paste tests passed!")
+
+def test_search_and_filter():
+    """Test the search index and the filtered todo list."""
+    print("\nTesting search and filters...")
+    
+    store = TodoStore([
+        TodoItem("Buy milk", todo_id="a", created_at=1),
+        TodoItem("Buy bread", todo_id="b", created_at=2, completed=True),
+        TodoItem("Call mom", todo_id="c", created_at=3),
+        TodoItem("Milkshake recipe", todo_id="d", created_at=4),
+    ])
+    names = lambda todos: [todo.name for todo in todos]
+    assert names(store.search("milk")) == ["Buy milk", "Milkshake recipe"]
+    assert names(store.search("BUY")) == ["Buy milk", "Buy bread"]
+    assert names(store.search("bu mi")) == ["Buy milk"]
+    assert names(store.search("buy", completed=True)) == ["Buy bread"]
+    assert names(store.search("xyz")) == []
+    assert len(list(store.search("  "))) == 4
+    
+    # The index follows adds, removes and bulk changes
+    store.add(TodoItem("Milk the cow", todo_id="e", created_at=5))
+    store.remove("a")
+    store.remove_many(["d"])
+    assert names(store.search("milk")) == ["Milk the cow"]
+    assert len(store.search_index) == 7
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    app.store.replace(TodoItem(f"Task {i} {'urgent' if i % 10 == 0 else 'later'}", todo_id=f"t{i:05d}") for i in range(500))
+    app.update_todo_list()
+    app.set_search_query("urg")
+    assert len(app.todo_rows) == 50 and all("urgent" in row.content.controls[1].controls[0].value for row in app.todo_list.controls)
+    
+    # Changes while filtered keep the list consistent with the query
+    app.todo_input.value = "New urgent task"
+    app.add_todo()
+    assert len(app.todo_rows) == 51
+    assert app.todo_list.controls[-1].key == app.store.at(len(app.store) - 1).id
+    app.toggle_todo_completed("t00000")
+    app.set_status_filter("completed")
+    assert [row.key for row in app.todo_list.controls] == ["t00000"]
+    app.set_search_query("nothing")
+    assert app.todo_list.controls == [app.empty_message] and app.empty_message.value == "No matching todos."
+    app.set_search_query("")
+    app.set_status_filter("all")
+    assert len(app.todo_rows) == app.render_limit
+    
+    started = time.perf_counter()
+    big = TodoStore(TodoItem(f"Item {i} word{i % 1000}", todo_id=f"i{i:06d}") for i in range(100_000))
+    build = time.perf_counter() - started
+    started = time.perf_counter()
+    hits = big.search("word12")
+    query = time.perf_counter() - started
+    assert len(hits) == 1100
+    print(f"100k index build {build * 1000:.0f} ms, prefix query {query * 1000:.1f} ms")
+    
+    print("✅ Search and filter tests passed!")
+
+def test_merge_import():
+    """Test merging an export into the current todos."""
+    print("\nTesting merge import...")
+    
+    page = FakePage()
+    app = TodoApp(page, save_delay=0)
+    app.store.replace([
+        TodoItem("Buy milk", todo_id="a", created_at=1000, modified_at=1000),
+        TodoItem("Call mom", todo_id="b", created_at=2000, modified_at=5000),
+        TodoItem("Water plants", todo_id="c", created_at=3000),
+    ])
+    incoming = [
+        TodoItem("Buy oat milk", todo_id="a", created_at=1000, modified_at=4000),  # newer: update
+        TodoItem("Call dad", todo_id="b", created_at=2000, modified_at=3000),      # older: skip
+        TodoItem("water plants ", todo_id="x", created_at=3000),                    # same content: skip
+        TodoItem("Water plants", todo_id="y", created_at=3000, completed=True, modified_at=6000),
+        TodoItem("Read book", todo_id="d", created_at=4000),                        # new: add
+        TodoItem("Read book", todo_id="d", created_at=4000),                        # repeated: skip
+    ]
+    
+    # The merge survives an export round trip, including modification times
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "other-machine.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([todo.to_dict() for todo in incoming], f)
+        writes = page.client_storage.write_count
+        app.merge_todos_from_file(SimpleNamespace(files=[SimpleNamespace(path=path)]))
+    
+    names = {todo.id: (todo.name, todo.completed) for todo in app.store}
+    assert names == {
+        "a": ("Buy oat milk", False),
+        "b": ("Call mom", False),
+        "c": ("Water plants", True),
+        "d": ("Read book", False),
+    }
+    assert app.status_message.value.endswith("1 added, 2 updated, 3 skipped")
+    assert page.client_storage.write_count - writes == 2  # one journal entry
+    assert [todo.id for todo in app.store.search("oat milk")] == ["a"]
+    
+    # A plan computed from a copy keeps changes made to the store meanwhile
+    store = TodoStore([TodoItem("Buy milk", todo_id="a", created_at=1000, modified_at=1000)])
+    plan = store.plan_merge([
+        TodoItem("Buy oat milk", todo_id="a", created_at=1000, modified_at=4000),
+        TodoItem("Read book", todo_id="d", created_at=4000),
+    ], list(store))
+    store.get("a").modified_at = 5000
+    store.add(TodoItem("Read book", todo_id="d", created_at=4000))
+    added, updated, skipped = store.apply_merge_plan(plan)
+    assert (added, updated, skipped) == ([], [], 2)
+    assert store.get("a").name == "Buy milk"
+    
+    # Toggling records a modification time that is saved and reloaded
+    before = app.store.get("b").modified_at
+    app.toggle_todo_completed("b")
+    assert app.store.get("b").modified_at > before
+    reloaded = {todo.id: todo for todo in ClientStorageJournal(page.client_storage).load()}
+    assert reloaded["b"].modified_time == app.store.get("b").modified_time
+    
+    # SQLite databases without the modification time column are upgraded
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE todos (id TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                     "creation_time TEXT NOT NULL, completed INTEGER NOT NULL)")
+        conn.execute("INSERT INTO todos VALUES ('old', 'Old todo', '2024-01-01T00:00:00', 0)")
+        conn.commit()
+        conn.close()
+        backend = SQLiteBackend(path)
+        [old] = backend.load()
+        assert old.modified_at == old.created_at
+        backend.apply([put_record(app.store.get("b"))])
+        assert len(backend.load()) == 2
+        backend.close()
+    print(f"Merge status: {app.status_message.value}")
+    
+    print("✅ Merge import tests passed!")
+
 if __name__ == "__main__":
     test_todo_item()
+    test_todo_item_timestamps()
+    test_todo_ids()
     test_json_serialization()
+    test_update_todo_list_reuses_rows()
+    test_todo_store_order()
+    test_todo_list_render_window()
+    test_journaled_persistence()
+    test_debounced_saving()
+    test_sqlite_backend()
+    test_streaming_import()
+    test_streaming_export()
+    test_instrumentation()
+    test_targeted_updates()
+    test_timer_scheduler()
+    test_async_app()
+    test_shared_sessions()
+    test_bulk_operations()
+    test_multiline_paste()
+    test_search_and_filter()
+    test_merge_import()
     print("\n🎉 All tests completed successfully!")
\ No newline at end of file
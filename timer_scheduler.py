@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Delayed work for the Flet Todo List Application.
+
+All delayed callbacks (clearing status messages, starting write-behind
+saves) run on one daemon thread that sleeps until the earliest deadline in a
+heap, so the number of threads stays constant however many timers are
+started. Callbacks must be quick; anything that can block hands its work off.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class _Timer:
+    __slots__ = ("deadline", "seq", "key", "callback", "cancelled")
+
+    def __init__(self, deadline: float, seq: int, key: Optional[Hashable], callback: Callable[[], Any]):
+        self.deadline = deadline
+        self.seq = seq
+        self.key = key
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other: "_Timer") -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class TimerScheduler:
+    """Runs callbacks after a delay on a single worker thread.
+
+    A timer started with a key replaces any pending timer with the same key,
+    which is how superseded work (e.g. clearing an older status message)
+    is cancelled.
+    """
+
+    def __init__(self):
+        self._heap: List[_Timer] = []
+        self._keyed: Dict[Hashable, _Timer] = {}
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of timers that have not run or been cancelled."""
+        with self._condition:
+            return sum(1 for timer in self._heap if not timer.cancelled)
+
+    def call_later(self, delay: float, callback: Callable[[], Any], key: Hashable = None):
+        """Run callback after `delay` seconds, replacing a pending timer with the same key."""
+        with self._condition:
+            timer = _Timer(time.monotonic() + delay, next(self._seq), key, callback)
+            if key is not None:
+                previous = self._keyed.get(key)
+                if previous is not None:
+                    previous.cancelled = True
+                self._keyed[key] = timer
+            heapq.heappush(self._heap, timer)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="TimerScheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, key: Hashable):
+        """Cancel the pending timer with the given key, if any."""
+        with self._condition:
+            timer = self._keyed.pop(key, None)
+            if timer is not None:
+                timer.cancelled = True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    timeout = self._heap[0].deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                timer = heapq.heappop(self._heap)
+                if timer.key is not None and self._keyed.get(timer.key) is timer:
+                    del self._keyed[timer.key]
+            try:
+                timer.callback()
+            except Exception as e:
+                print(f"Error in scheduled callback: {e}")
+
+
+# Scheduler shared by all sessions of the app in this process
+default_scheduler = TimerScheduler()
@@ -9,60 +9,97 @@ A single-page application (SPA) for managing todo items with the following featu
 - Data persistence using browser localStorage
 - Dynamic UI updates
 - Export/Import todos to/from JSON files
+- Search and pending/completed filters
 """
 
 import flet as ft
 import json
-from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional, Set
 import os
+import threading
 
+from todo_io import iter_todo_batches, write_todos
+from timer_scheduler import TimerScheduler, default_scheduler
+from todo_store import TodoItem, TodoStore
+from update_scheduler import UpdateScheduler
+from todo_storage import (
+    ClientStorageJournal, SQLiteBackend, StorageBackend, WriteBehindSaver,
+    delete_record, put_record
+)
 
-class TodoItem:
-    """Represents a single todo item with name, creation time, and completion status."""
-    
-    def __init__(self, name: str, creation_time: str = None, completed: bool = False, todo_id: str = None):
-        self.name = name
-        self.creation_time = creation_time or datetime.now().isoformat()
-        self.completed = completed
-        self.id = todo_id or str(hash(f"{name}_{self.creation_time}"))
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert todo item to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "creation_time": self.creation_time,
-            "completed": self.completed
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'TodoItem':
-        """Create todo item from dictionary."""
-        return cls(
-            name=data["name"],
-            creation_time=data["creation_time"],
-            completed=data["completed"],
-            todo_id=data["id"]
-        )
+
+class TodoRow(ft.Container):
+    """Container for one todo row.
+    
+    Rows are isolated: updating the todo list only diffs the list of rows,
+    not every control inside them. A changed row is updated on its own.
+    """
+    
+    def is_isolated(self):
+        return True
 
 
 class TodoApp:
     """Main Todo List Application."""
     
-    def __init__(self, page: ft.Page):
+    # Number of rows materialized at a time in the todo list
+    PAGE_SIZE = 100
+    
+    # Most pages of rows rendered at once; scrolling further slides the
+    # rendered window along the list instead of growing it
+    RENDER_WINDOW_PAGES = 5
+    
+    # Seconds a status message stays visible
+    STATUS_MESSAGE_DURATION = 5
+    
+    # Values of the status filter chips
+    STATUS_FILTERS = {"all": None, "pending": False, "completed": True}
+    
+    # Most todos created from one multi-line paste, and how many are
+    # created between progress updates
+    MAX_PASTE_LINES = 10000
+    PASTE_PROGRESS_BATCH = 1000
+    
+    def __init__(self, page: ft.Page, page_size: int = PAGE_SIZE,
+                 save_delay: float = WriteBehindSaver.SAVE_DELAY,
+                 storage: StorageBackend = None, timers: TimerScheduler = None):
         self.page = page
-        self.todos: List[TodoItem] = []
+        self.store = TodoStore()
+        # One scheduler thread owns all delayed work (status clears, saves)
+        self.timers = timers or default_scheduler
+        # Persist to the browser's localStorage unless another backend is given
+        self.storage = storage or ClientStorageJournal(page.client_storage)
+        # Writes run on this session's executor, not on the timer thread
+        self.saver = WriteBehindSaver(self.storage, save_delay, self.timers,
+                                      run=getattr(page, "run_thread", None))
+        # Handlers mark changed controls; only those are sent to the client
+        self.ui = UpdateScheduler(page)
+        self.page_size = page_size
+        # Only the render_limit todos from display position render_start on
+        # get rows; scrolling grows and then slides this window
+        self.render_start = 0
+        self.render_limit = page_size
         
         # Configure page
         self.page.title = "Flet Todo List"
         self.page.theme_mode = ft.ThemeMode.LIGHT
         self.page.padding = 20
         
+        # Write out pending changes when the client disconnects, and
+        # release the storage backend when the session ends
+        self.page.on_disconnect = self.flush_saves
+        self.page.on_close = self.close_session
+        
         # UI components
+        # Enter submits; pasted or Shift+Enter line breaks make one todo per line
         self.todo_input = ft.TextField(
-            hint_text="Enter a new todo item...",
+            hint_text="Enter a new todo item (or paste a list, one per line)...",
             expand=True,
+            multiline=True,
+            shift_enter=True,
+            min_lines=1,
+            max_lines=5,
             on_submit=self.add_todo
         )
         
@@ -71,9 +108,46 @@ class TodoApp:
             on_click=self.add_todo
         )
         
-        self.todo_list = ft.Column(
+        self.todo_list = ft.ListView(
             spacing=10,
-            scroll=ft.ScrollMode.AUTO
+            expand=True,
+            on_scroll_interval=50,
+            on_scroll=self.on_todo_list_scroll
+        )
+        
+        # Only todos matching the search query and status filter are listed
+        self.search_query = ""
+        self.status_filter = "all"
+        self.search_input = ft.TextField(
+            hint_text="Search todos...",
+            prefix_icon=ft.icons.SEARCH,
+            expand=True,
+            dense=True,
+            on_change=self.on_search_change
+        )
+        self.filter_chips = [
+            ft.Chip(
+                label=ft.Text(status.capitalize()),
+                data=status,
+                selected=(status == self.status_filter),
+                on_select=self.on_filter_select
+            )
+            for status in self.STATUS_FILTERS
+        ]
+        
+        # Rendered rows keyed by todo id, reused across list updates
+        self.todo_rows: Dict[str, TodoRow] = {}
+        
+        # Ids of the todos selected for bulk operations; the anchor is where
+        # a long-press range selection starts
+        self.selected: Set[str] = set()
+        self.selection_anchor = None
+        self.selection_text = ft.Text("", size=14, color=ft.colors.BLUE_700)
+        self.empty_message = ft.Text(
+            "No todos yet. Add one above!",
+            size=16,
+            color=ft.colors.GREY_500,
+            italic=True
         )
         
         # Status message text
@@ -90,6 +164,13 @@ class TodoApp:
         )
         self.page.overlay.append(self.file_picker)
         
+        # Write exports without indentation when checked
+        self.compact_export = ft.Checkbox(
+            label="Compact JSON",
+            value=False,
+            tooltip="Export without indentation (smaller files)"
+        )
+        
         # Track current file operation
         self.current_operation = None
         
@@ -107,6 +188,27 @@ class TodoApp:
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN
         )
         
+        # Search box and status filter
+        search_row = ft.Row(
+            [self.search_input, *self.filter_chips],
+            spacing=8
+        )
+        
+        # Bulk actions on the selected todos
+        bulk_row = ft.Row(
+            [
+                ft.TextButton("Select all", on_click=self.select_all),
+                ft.TextButton("Select none", on_click=self.clear_selection),
+                ft.TextButton("Complete", icon=ft.icons.DONE_ALL, on_click=self.complete_selected),
+                ft.TextButton("Uncomplete", icon=ft.icons.REMOVE_DONE, on_click=self.uncomplete_selected),
+                ft.TextButton("Delete selected", icon=ft.icons.DELETE_SWEEP, on_click=self.delete_selected),
+                ft.TextButton("Clear completed", icon=ft.icons.CLEANING_SERVICES, on_click=self.clear_completed),
+                self.selection_text
+            ],
+            wrap=True,
+            spacing=0
+        )
+        
         # Import/Export buttons at the bottom
         export_button = ft.ElevatedButton(
             text="📥 Export to JSON",
@@ -122,8 +224,15 @@ class TodoApp:
             tooltip="Import todos from a JSON file"
         )
         
+        merge_button = ft.ElevatedButton(
+            text="🔀 Merge from JSON",
+            icon=ft.icons.MERGE_TYPE,
+            on_click=self.merge_todos_dialog,
+            tooltip="Add and update todos from a JSON file, keeping the current ones"
+        )
+        
         button_row = ft.Row(
-            [export_button, import_button],
+            [export_button, import_button, merge_button, self.compact_export],
             alignment=ft.MainAxisAlignment.CENTER,
             spacing=10
         )
@@ -136,71 +245,283 @@ class TodoApp:
                 input_row,
                 ft.Divider(),
                 ft.Text("Your Todos:", size=18, weight=ft.FontWeight.W_500),
+                search_row,
+                bulk_row,
                 self.todo_list,
                 ft.Divider(),
                 button_row,
                 self.status_message
-            ]),
-            padding=20
+            ], expand=True),
+            padding=20,
+            expand=True
         )
         
         self.page.add(main_container)
         self.update_todo_list()
     
+    @property
+    def todos(self) -> List[TodoItem]:
+        """All todos in display order."""
+        return list(self.store)
+    
     def add_todo(self, e=None):
-        """Add a new todo item."""
-        text = self.todo_input.value.strip()
-        if text:
-            todo = TodoItem(name=text)
-            self.todos.append(todo)
+        """Add a new todo item, or one per line of multi-line input."""
+        names = [line.strip() for line in self.todo_input.value.splitlines()]
+        names = [name for name in names if name]
+        if len(names) > 1:
+            self.add_todos(names)
+        elif names:
+            with self.ui.batch():
+                todo = TodoItem(name=names[0])
+                index = self.store.add(todo)
+                self.todo_input.value = ""
+                self.ui.mark(self.todo_input)
+                self.record_changes([put_record(todo)])
+                self.insert_todo_row(todo, index)
+                self.notify_change("add", todo.id, (index,))
+    
+    def add_todos(self, names: List[str]) -> List[TodoItem]:
+        """Add one todo per name in a single batch, e.g. for a pasted list.
+        
+        The todos are inserted into the store together, saved as one
+        change record batch and rendered with one list update. Only the
+        first MAX_PASTE_LINES names are used. Returns the new todos.
+        """
+        skipped = max(0, len(names) - self.MAX_PASTE_LINES)
+        names = names[:self.MAX_PASTE_LINES]
+        with self.ui.batch():
+            todos = []
+            for start in range(0, len(names), self.PASTE_PROGRESS_BATCH):
+                todos.extend(TodoItem(name=name) for name in names[start:start + self.PASTE_PROGRESS_BATCH])
+                if len(names) > self.PASTE_PROGRESS_BATCH:
+                    self.show_paste_progress(len(todos), len(names))
+            self.store.add_many(todos)
             self.todo_input.value = ""
-            self.save_todos()
+            self.ui.mark(self.todo_input)
+            self.record_changes([put_record(todo) for todo in todos])
             self.update_todo_list()
-            self.page.update()
+            self.notify_change("bulk")
+            
+            if skipped:
+                self.show_status_message(
+                    f"⚠️ Added {len(todos)} todos; {skipped} lines over the limit of "
+                    f"{self.MAX_PASTE_LINES} were skipped",
+                    ft.colors.ORANGE_700
+                )
+            else:
+                self.show_status_message(f"✅ Added {len(todos)} todos")
+        return todos
     
     def toggle_todo_completed(self, todo_id: str):
         """Toggle the completion status of a todo item."""
-        for todo in self.todos:
-            if todo.id == todo_id:
-                todo.completed = not todo.completed
-                break
-        self.save_todos()
-        self.update_todo_list()
-        self.page.update()
+        with self.ui.batch():
+            # Checked under the UI lock: a double-click runs two handlers
+            if todo_id not in self.store:
+                return
+            todo, old_index, new_index = self.store.toggle(todo_id)
+            self.record_changes([put_record(todo)])
+            self.move_todo_row(todo, old_index, new_index)
+            self.notify_change("toggle", todo_id, (old_index, new_index))
     
     def delete_todo(self, todo_id: str):
         """Delete a todo item."""
-        self.todos = [todo for todo in self.todos if todo.id != todo_id]
-        self.save_todos()
-        self.update_todo_list()
-        self.page.update()
+        with self.ui.batch():
+            if todo_id not in self.store:
+                return
+            _, index = self.store.remove(todo_id)
+            self.record_changes([delete_record(todo_id)])
+            self.remove_todo_row(todo_id, index)
+            if todo_id in self.selected:
+                self.selected.discard(todo_id)
+                self.update_selection_text()
+            self.notify_change("delete", todo_id, (index,))
     
-    def create_todo_row(self, todo: TodoItem) -> ft.Row:
-        """Create a UI row for a todo item."""
-        # Format creation time for display
-        try:
-            dt = datetime.fromisoformat(todo.creation_time)
-            time_str = dt.strftime("%m/%d/%Y %H:%M")
-        except:
-            time_str = "Unknown"
+    def set_completed(self, todo_ids: Iterable[str], completed: bool = True) -> int:
+        """Mark several todos completed (or pending) in one transaction.
         
+        The store is updated in one pass, all change records go to the
+        storage backend as one write and the UI is flushed once. Returns
+        the number of todos that changed.
+        """
+        with self.ui.batch():
+            changed = self.store.set_completed(todo_ids, completed)
+            if changed:
+                self.record_changes([put_record(todo) for todo in changed])
+                self.update_todo_list()
+                self.notify_change("bulk")
+            return len(changed)
+    
+    def delete_todos(self, todo_ids: Iterable[str]) -> int:
+        """Delete several todos in one transaction; returns how many were deleted."""
+        with self.ui.batch():
+            removed = self.store.remove_many(todo_ids)
+            if removed:
+                self.selected.difference_update(todo.id for todo in removed)
+                self.record_changes([delete_record(todo.id) for todo in removed])
+                self.update_todo_list()
+                self.update_selection_text()
+                self.notify_change("bulk")
+            return len(removed)
+    
+    def select(self, todo_ids: Iterable[str], selected: bool = True):
+        """Add todos to the selection, or remove them when selected is False."""
+        with self.ui.batch():
+            todo_ids = [todo_id for todo_id in todo_ids if todo_id in self.store]
+            if selected:
+                self.selected.update(todo_ids)
+            else:
+                self.selected.difference_update(todo_ids)
+            self.refresh_rendered_rows()
+            self.update_selection_text()
+    
+    def select_range(self, start: int, stop: int):
+        """Select the listed todos at positions start (inclusive) to stop (exclusive)."""
+        self.select(todo.id for todo in islice(self.visible_todos(), max(start, 0), stop))
+    
+    def select_all(self, e=None):
+        """Select every listed todo (all todos unless a search or filter is active)."""
+        self.select(todo.id for todo in self.visible_todos())
+    
+    def clear_selection(self, e=None):
+        """Deselect all todos."""
+        self.select(list(self.selected), selected=False)
+        self.selection_anchor = None
+    
+    def complete_selected(self, e=None) -> int:
+        """Mark the selected todos completed."""
+        with self.ui.batch():
+            count = self.set_completed(list(self.selected), True)
+            self.show_status_message(f"✅ Completed {count} todos")
+        return count
+    
+    def uncomplete_selected(self, e=None) -> int:
+        """Mark the selected todos pending again."""
+        with self.ui.batch():
+            count = self.set_completed(list(self.selected), False)
+            self.show_status_message(f"✅ Reopened {count} todos")
+        return count
+    
+    def delete_selected(self, e=None) -> int:
+        """Delete the selected todos."""
+        with self.ui.batch():
+            count = self.delete_todos(list(self.selected))
+            self.show_status_message(f"🗑️ Deleted {count} todos")
+        return count
+    
+    def clear_completed(self, e=None) -> int:
+        """Delete all completed todos."""
+        with self.ui.batch():
+            count = self.delete_todos([todo.id for todo in self.store.completed_todos()])
+            self.show_status_message(f"🗑️ Cleared {count} completed todos")
+        return count
+    
+    def update_selection_text(self):
+        """Show how many todos are selected."""
+        self.selection_text.value = f"{len(self.selected)} selected" if self.selected else ""
+        self.ui.mark(self.selection_text)
+    
+    def refresh_rendered_rows(self):
+        """Restyle rendered rows whose todo or selection state changed."""
+        for todo_id, row in self.todo_rows.items():
+            self.refresh_todo_row(row, self.store.get(todo_id))
+    
+    def on_row_click(self, e):
+        """Toggle the selection of the clicked row (its key is the todo id)."""
+        todo_id = e.control.key
+        self.select([todo_id], selected=todo_id not in self.selected)
+        self.selection_anchor = todo_id
+    
+    def on_row_long_press(self, e):
+        """Select all todos between the last clicked row and this one."""
+        todo_id = e.control.key
+        index = self.visible_index(todo_id)
+        if index is None:
+            return
+        start = self.visible_index(self.selection_anchor)
+        if start is None:
+            start = index
+        self.select_range(min(start, index), max(start, index) + 1)
+        self.selection_anchor = todo_id
+    
+    @property
+    def filtered(self) -> bool:
+        """Whether a search query or status filter hides some todos."""
+        return bool(self.search_query.strip()) or self.status_filter != "all"
+    
+    def visible_todos(self) -> Iterable[TodoItem]:
+        """Todos matching the search query and status filter, in display order."""
+        completed = self.STATUS_FILTERS[self.status_filter]
+        if self.search_query:
+            return self.store.search(self.search_query, completed)
+        return self.store.view(completed)
+    
+    def visible_index(self, todo_id: str) -> Optional[int]:
+        """Position of a todo among the listed todos, or None if it is not listed."""
+        if todo_id not in self.store:
+            return None
+        if not self.filtered:
+            return self.store.index_of(todo_id)
+        for index, todo in enumerate(self.visible_todos()):
+            if todo.id == todo_id:
+                return index
+        return None
+    
+    def set_search_query(self, query: str):
+        """List only the todos matching query."""
+        with self.ui.batch():
+            self.search_query = query
+            self.reset_render_window()
+            self.update_todo_list()
+    
+    def set_status_filter(self, status: str):
+        """List all, only pending or only completed todos."""
+        with self.ui.batch():
+            self.status_filter = status
+            for chip in self.filter_chips:
+                chip.selected = chip.data == status
+                self.ui.mark(chip)
+            self.reset_render_window()
+            self.update_todo_list()
+    
+    def on_search_change(self, e):
+        """Update the listed todos as the search box is typed in."""
+        self.set_search_query(self.search_input.value or "")
+    
+    def on_filter_select(self, e):
+        """Switch the status filter to the chip that was clicked."""
+        self.set_status_filter(e.control.data)
+    
+    def notify_change(self, op: str, todo_id: str = None, indices: tuple = ()):
+        """Called after each change to the store.
+        
+        op is "add", "toggle", "delete", "bulk" (several todos changed) or
+        "replace" (all todos replaced); indices are the display positions
+        a single-todo change touched. The shared
+        app broadcasts changes to other sessions from here.
+        """
+    
+    def on_checkbox_change(self, e):
+        """Toggle the todo whose checkbox was clicked (its id is the control's data)."""
+        self.toggle_todo_completed(e.control.data)
+    
+    def on_delete_click(self, e):
+        """Delete the todo whose delete button was clicked."""
+        self.delete_todo(e.control.data)
+    
+    def create_todo_row(self, todo: TodoItem) -> TodoRow:
+        """Create a UI row for a todo item."""
         # Create checkbox for completion status
         checkbox = ft.Checkbox(
-            value=todo.completed,
-            on_change=lambda e: self.toggle_todo_completed(todo.id)
+            data=todo.id,
+            on_change=self.on_checkbox_change
         )
         
-        # Create todo text with strikethrough if completed
-        todo_text = ft.Text(
-            todo.name,
-            size=16,
-            color=ft.colors.GREY_600 if todo.completed else ft.colors.BLACK,
-            style=ft.TextStyle(decoration=ft.TextDecoration.LINE_THROUGH) if todo.completed else None
-        )
+        # Create todo text
+        todo_text = ft.Text(todo.name, size=16)
         
         # Create time text
         time_text = ft.Text(
-            time_str,
+            todo.display_time,
             size=12,
             color=ft.colors.GREY_500
         )
@@ -209,12 +530,13 @@ class TodoApp:
         delete_button = ft.IconButton(
             icon=ft.icons.DELETE,
             icon_color=ft.colors.RED_400,
-            on_click=lambda e: self.delete_todo(todo.id),
+            data=todo.id,
+            on_click=self.on_delete_click,
             tooltip="Delete todo"
         )
         
         # Create the row layout
-        return ft.Container(
+        row = TodoRow(
             content=ft.Row([
                 checkbox,
                 ft.Column([
@@ -223,53 +545,253 @@ class TodoApp:
                 ], spacing=2),
                 delete_button
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            key=todo.id,
+            on_click=self.on_row_click,
+            on_long_press=self.on_row_long_press,
             padding=10,
-            border=ft.border.all(1, ft.colors.GREY_300),
-            border_radius=8,
-            bgcolor=ft.colors.GREY_50 if todo.completed else ft.colors.WHITE
+            border_radius=8
         )
+        self.refresh_todo_row(row, todo)
+        return row
     
-    def update_todo_list(self):
-        """Update the todo list display."""
-        self.todo_list.controls.clear()
-        
-        if not self.todos:
-            self.todo_list.controls.append(
-                ft.Text(
-                    "No todos yet. Add one above!",
-                    size=16,
-                    color=ft.colors.GREY_500,
-                    italic=True
-                )
-            )
+    def refresh_todo_row(self, row: TodoRow, todo: TodoItem):
+        """Apply the completion and selection state of a todo to an existing row."""
+        # row.data remembers the state last rendered so unchanged rows are skipped
+        selected = todo.id in self.selected
+        state = (todo.name, todo.completed, selected)
+        if row.data == state:
+            return
+        checkbox, details, _ = row.content.controls
+        todo_text = details.controls[0]
+        
+        checkbox.value = todo.completed
+        todo_text.value = todo.name
+        # Strikethrough text if completed
+        todo_text.color = ft.colors.GREY_600 if todo.completed else ft.colors.BLACK
+        todo_text.style = ft.TextStyle(decoration=ft.TextDecoration.LINE_THROUGH) if todo.completed else None
+        row.bgcolor = ft.colors.GREY_50 if todo.completed else ft.colors.WHITE
+        row.border = ft.border.all(2, ft.colors.BLUE_400) if selected else ft.border.all(1, ft.colors.GREY_300)
+        row.data = state
+        self.ui.mark(row)
+    
+    def insert_todo_row(self, todo: TodoItem, index: int):
+        """Render a row for a newly added todo at its display position."""
+        if self.filtered or index < self.render_start:
+            # A todo before the window shifts every rendered todo
+            self.update_todo_list()
+            return
+        index -= self.render_start
+        controls = self.clear_empty_message()
+        if index <= len(controls):
+            row = self.create_todo_row(todo)
+            self.todo_rows[todo.id] = row
+            controls.insert(index, row)
+            self.ui.mark(self.todo_list)
+        self.fill_render_window()
+    
+    def move_todo_row(self, todo: TodoItem, old_index: int, new_index: int):
+        """Restyle the row of a changed todo and move it to its new position."""
+        if self.filtered or min(old_index, new_index) < self.render_start:
+            self.update_todo_list()
+            return
+        old_index -= self.render_start
+        new_index -= self.render_start
+        controls = self.todo_list.controls
+        row = self.todo_rows.get(todo.id)
+        if row is not None and old_index == new_index:
+            # Same position: only the row itself changes
+            self.refresh_todo_row(row, todo)
+            return
+        
+        if self.todo_rows.pop(todo.id, None) is not None:
+            controls.pop(old_index)
+            self.ui.mark(self.todo_list)
+        if new_index <= len(controls):
+            if row is None:
+                row = self.create_todo_row(todo)
+            else:
+                self.refresh_todo_row(row, todo)
+            self.todo_rows[todo.id] = row
+            controls.insert(new_index, row)
+            self.ui.mark(self.todo_list)
+        self.fill_render_window()
+    
+    def remove_todo_row(self, todo_id: str, index: int):
+        """Remove the row of a deleted todo."""
+        if self.filtered or index < self.render_start:
+            self.update_todo_list()
+            return
+        if self.todo_rows.pop(todo_id, None) is not None:
+            del self.todo_list.controls[index - self.render_start]
+            self.ui.mark(self.todo_list)
+        self.fill_render_window()
+    
+    def clear_empty_message(self) -> List[ft.Control]:
+        """Drop the empty-list placeholder and return the row controls."""
+        if self.todo_list.controls and self.todo_list.controls[0] is self.empty_message:
+            self.todo_list.controls.clear()
+            self.ui.mark(self.todo_list)
+        return self.todo_list.controls
+    
+    def placeholder(self) -> ft.Text:
+        """The message shown instead of rows when no todo is listed."""
+        if self.filtered and self.store:
+            self.empty_message.value = "No matching todos."
         else:
-            # Sort todos: incomplete first, then by creation time
-            sorted_todos = sorted(
-                self.todos,
-                key=lambda x: (x.completed, x.creation_time)
-            )
-            
-            for todo in sorted_todos:
-                self.todo_list.controls.append(self.create_todo_row(todo))
+            self.empty_message.value = "No todos yet. Add one above!"
+        return self.empty_message
+    
+    def fill_render_window(self):
+        """Make the rendered rows cover exactly the todos of the render window."""
+        if self.render_start and self.render_start + self.render_limit > len(self.store):
+            # The list got shorter than the window reaches; move it back
+            self.update_todo_list()
+            return
+        controls = self.clear_empty_message()
+        limit = min(self.render_limit, len(self.store))
+        if len(controls) == limit and controls:
+            return
+        while len(controls) > limit:
+            row = controls.pop()
+            self.todo_rows.pop(row.key, None)
+        while len(controls) < limit:
+            todo = self.store.at(self.render_start + len(controls))
+            row = self.create_todo_row(todo)
+            self.todo_rows[todo.id] = row
+            controls.append(row)
+        if not controls:
+            controls.append(self.placeholder())
+        self.ui.mark(self.todo_list)
+    
+    def reset_render_window(self):
+        """Render rows from the top of the list again, one page of them."""
+        self.render_start = 0
+        self.render_limit = self.page_size
+    
+    def show_more_todos(self) -> int:
+        """Materialize the next page of rows.
+        
+        Once RENDER_WINDOW_PAGES pages are rendered, the rows at the top of
+        the window are dropped as rows are added at its end, so the number
+        of rows stays bounded however far the list is scrolled. Returns the
+        number of rows dropped from the top.
+        """
+        # A full window means there may be more todos to list
+        if len(self.todo_rows) < self.render_limit:
+            return 0
+        with self.ui.batch():
+            start = self.render_start
+            if self.render_limit < self.page_size * self.RENDER_WINDOW_PAGES:
+                self.render_limit += self.page_size
+            else:
+                self.render_start += self.page_size
+            self.update_todo_list()
+        return self.render_start - start
+    
+    def show_earlier_todos(self) -> int:
+        """Materialize the page of rows before the window, dropping rows at its end.
+        
+        Returns the number of rows added at the top.
+        """
+        if not self.render_start:
+            return 0
+        with self.ui.batch():
+            start = self.render_start
+            self.render_start = max(0, start - self.page_size)
+            self.update_todo_list()
+        return start - self.render_start
+    
+    def on_todo_list_scroll(self, e: ft.OnScrollEvent):
+        """Slide the rendered rows along when the list is scrolled close to either end.
+        
+        Rows added or dropped at the top would move the rows in view, so
+        the list is scrolled by their height (estimated from the average
+        height of the rendered rows) to keep them in place.
+        """
+        row_extent = (e.max_scroll_extent + e.viewport_dimension) / max(1, len(self.todo_list.controls))
+        if e.max_scroll_extent - e.pixels < 2 * e.viewport_dimension:
+            shift = -self.show_more_todos()
+        elif e.pixels < 2 * e.viewport_dimension:
+            shift = self.show_earlier_todos()
+        else:
+            return
+        if shift:
+            with self.ui.batch():
+                self.todo_list.scroll_to(offset=max(0.0, e.pixels + shift * row_extent))
+    
+    def window_todos(self) -> List[TodoItem]:
+        """The listed todos in the render window.
+        
+        If the list got shorter than the window reaches, the window is
+        moved back so that it stays full.
+        """
+        if self.filtered:
+            listed = list(islice(self.visible_todos(), self.render_start + self.render_limit))
+            count, todo_at = len(listed), listed.__getitem__
+        else:
+            count, todo_at = len(self.store), self.store.at
+        if self.render_start + self.render_limit > count:
+            self.render_start = max(0, count - self.render_limit)
+        return [todo_at(index) for index in range(self.render_start, min(count, self.render_start + self.render_limit))]
+    
+    def update_todo_list(self):
+        """Update the whole todo list display, e.g. after loading or importing.
+        
+        Rows are reconciled by todo id: existing rows are reused and only
+        restyled when their completion state changed, new todos get a new
+        row and rows of deleted todos are dropped. Flet then only sends the
+        changed and moved controls to the client. Single add/toggle/delete
+        actions use the targeted row helpers above instead.
+        
+        Only the todos in the render window are rendered; rows are built
+        and dropped as the list is scrolled. While a search or
+        status filter is active, only matching todos are listed and every
+        change is rendered through this method.
+        """
+        rows = {}
+        controls = []
+        for todo in self.window_todos():
+            row = self.todo_rows.get(todo.id)
+            if row is None:
+                row = self.create_todo_row(todo)
+            else:
+                self.refresh_todo_row(row, todo)
+            rows[todo.id] = row
+            controls.append(row)
+        
+        if not controls:
+            controls.append(self.placeholder())
+        
+        self.todo_rows = rows
+        self.todo_list.controls = controls
+        self.ui.mark(self.todo_list)
+    
+    def record_changes(self, records: List[Dict[str, Any]]):
+        """Queue change records for the storage backend."""
+        self.saver.add(records)
+        if self.storage.needs_compaction() and not self.saver.snapshot_pending:
+            self.save_todos()
     
     def save_todos(self):
-        """Save todos to localStorage."""
-        try:
-            todos_data = [todo.to_dict() for todo in self.todos]
-            self.page.client_storage.set("todos", json.dumps(todos_data))
-        except Exception as e:
-            print(f"Error saving todos: {e}")
+        """Queue a snapshot of all todos for the storage backend."""
+        self.saver.request_snapshot(self.todos)
+    
+    def flush_saves(self, e=None):
+        """Write queued changes to the storage backend immediately."""
+        self.saver.flush()
+    
+    def close_session(self, e=None):
+        """Write queued changes, then close the storage backend."""
+        self.saver.flush()
+        self.storage.close()
     
     def load_todos(self):
-        """Load todos from localStorage."""
+        """Load todos from the storage backend."""
         try:
-            todos_json = self.page.client_storage.get("todos")
-            if todos_json:
-                todos_data = json.loads(todos_json)
-                self.todos = [TodoItem.from_dict(data) for data in todos_data]
+            self.store.replace(self.storage.load())
         except Exception as e:
             print(f"Error loading todos: {e}")
-            self.todos = []
+            self.store.replace([])
     
     def export_todos_dialog(self, e=None):
         """Open file picker dialog to export todos to JSON."""
@@ -291,97 +813,218 @@ class TodoApp:
             allow_multiple=False
         )
     
+    def merge_todos_dialog(self, e=None):
+        """Open file picker dialog to merge todos from JSON."""
+        self.current_operation = "merge"
+        self.file_picker.pick_files(
+            dialog_title="Merge Todos from JSON",
+            allowed_extensions=["json"],
+            file_type=ft.FilePickerFileType.CUSTOM,
+            allow_multiple=False
+        )
+    
     def file_picker_result(self, e: ft.FilePickerResultEvent):
-        """Handle file picker result for both import and export."""
+        """Handle file picker result for import, merge and export."""
         if self.current_operation == "export":
             self.export_todos_to_file(e)
         elif self.current_operation == "import":
             self.import_todos_from_file(e)
+        elif self.current_operation == "merge":
+            self.merge_todos_from_file(e)
         self.current_operation = None
     
     def export_todos_to_file(self, e: ft.FilePickerResultEvent):
-        """Export todos to a JSON file."""
+        """Export todos to a JSON file.
+        
+        The file is written by a worker thread, which is returned so callers
+        can wait for it. The todos exported are the ones present right now.
+        """
+        if not e.path:
+            self.show_status_message("Export cancelled", ft.colors.GREY_600)
+            return None
+        indent = None if self.compact_export.value else 2
+        thread = threading.Thread(
+            target=self.write_export,
+            args=(e.path, self.todos, indent),
+            daemon=True
+        )
+        thread.start()
+        return thread
+    
+    def write_export(self, path: str, todos: List[TodoItem], indent):
+        """Stream todos to a JSON file (runs on the export thread)."""
+        total = len(todos)
+        
+        def show_progress(count):
+            percent = int(count * 100 / total) if total else 100
+            self.status_message.value = f"⏳ Exporting... {count} of {total} todos ({percent}%)"
+            self.status_message.color = ft.colors.BLUE_700
+            self.ui.mark(self.status_message)
+            self.ui.flush()
+        
         try:
-            if e.path:
-                # Prepare todos data
-                todos_data = [todo.to_dict() for todo in self.todos]
-                json_content = json.dumps(todos_data, indent=2, ensure_ascii=False)
-                
-                # Write to file
-                with open(e.path, 'w', encoding='utf-8') as f:
-                    f.write(json_content)
-                
-                self.show_status_message(
-                    f"✅ Exported {len(self.todos)} todos to {os.path.basename(e.path)}",
-                    ft.colors.GREEN_700
-                )
-            else:
-                self.show_status_message("Export cancelled", ft.colors.GREY_600)
+            with open(path, 'w', encoding='utf-8') as f:
+                count = write_todos(f, todos, indent=indent, progress=show_progress)
+            
+            self.show_status_message(
+                f"✅ Exported {count} todos to {os.path.basename(path)}",
+                ft.colors.GREEN_700
+            )
         except Exception as ex:
             self.show_status_message(f"❌ Error exporting: {str(ex)}", ft.colors.RED_700)
     
     def import_todos_from_file(self, e: ft.FilePickerResultEvent):
-        """Import todos from a JSON file."""
+        """Import todos from a JSON file, replacing the current todos."""
         try:
             if e.files and len(e.files) > 0:
                 file_path = e.files[0].path
-                
-                # Read from file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    json_content = f.read()
-                
-                # Parse JSON
-                todos_data = json.loads(json_content)
-                
-                # Validate data structure
-                if not isinstance(todos_data, list):
-                    raise ValueError("Invalid JSON format: expected a list of todos")
-                
-                # Import todos
-                imported_todos = [TodoItem.from_dict(data) for data in todos_data]
-                self.todos = imported_todos
-                
-                # Save to localStorage
-                self.save_todos()
-                
-                # Update UI
-                self.update_todo_list()
-                self.page.update()
-                
-                self.show_status_message(
-                    f"✅ Imported {len(imported_todos)} todos from {os.path.basename(file_path)}",
-                    ft.colors.GREEN_700
-                )
+                imported = self.read_import_file(file_path)
+                self.apply_import(imported, file_path)
             else:
                 self.show_status_message("Import cancelled", ft.colors.GREY_600)
-        except json.JSONDecodeError as ex:
-            self.show_status_message(f"❌ Invalid JSON file: {str(ex)}", ft.colors.RED_700)
         except Exception as ex:
+            self.show_import_error(ex)
+    
+    def read_import_file(self, file_path: str) -> TodoStore:
+        """Parse a JSON file incrementally into a new store.
+        
+        The current todos stay untouched, so nothing changes if the file
+        turns out to be invalid. Touches no app state other than the
+        progress message, so it may run on a worker thread.
+        """
+        imported = TodoStore()
+        for batch in self.iter_import_batches(file_path):
+            imported.add_many(batch)
+        return imported
+    
+    def iter_import_batches(self, file_path: str) -> Iterable[List[TodoItem]]:
+        """Yield the todos of a JSON file in batches, showing progress."""
+        file_size = os.path.getsize(file_path)
+        count = 0
+        with open(file_path, 'rb') as f:
+            for batch, bytes_read in iter_todo_batches(f):
+                count += len(batch)
+                yield batch
+                self.show_import_progress(count, bytes_read, file_size)
+    
+    def apply_import(self, imported: TodoStore, file_path: str):
+        """Replace all todos with an imported store and re-render the list."""
+        with self.ui.batch():
+            self.store = imported
+            self.selected.clear()
+            self.selection_anchor = None
+            self.update_selection_text()
+            
+            # Save to storage
+            self.save_todos()
+            
+            # Update UI
+            self.reset_render_window()
+            self.update_todo_list()
+            self.notify_change("replace")
+            
+            self.show_status_message(
+                f"✅ Imported {len(imported)} todos from {os.path.basename(file_path)}",
+                ft.colors.GREEN_700
+            )
+    
+    def merge_todos_from_file(self, e: ft.FilePickerResultEvent):
+        """Merge todos from a JSON file into the current todos."""
+        try:
+            if e.files and len(e.files) > 0:
+                file_path = e.files[0].path
+                incoming = self.read_merge_file(file_path)
+                self.apply_merge(incoming, file_path)
+            else:
+                self.show_status_message("Merge cancelled", ft.colors.GREY_600)
+        except Exception as ex:
+            self.show_import_error(ex)
+    
+    def read_merge_file(self, file_path: str) -> List[TodoItem]:
+        """Parse a JSON file incrementally into a list of todos (may run on a worker thread)."""
+        return [todo for batch in self.iter_import_batches(file_path) for todo in batch]
+    
+    def apply_merge(self, incoming: Iterable[TodoItem], source: str = "") -> tuple:
+        """Merge todos into the store (see TodoStore.merge) as one transaction.
+        
+        Added and updated todos are saved as one change record batch and
+        the list is re-rendered once. Returns (added, updated, skipped)
+        counts.
+        """
+        with self.ui.batch():
+            return self.apply_merge_plan(self.store.plan_merge(incoming), source)
+    
+    def apply_merge_plan(self, plan: tuple, source: str = "") -> tuple:
+        """Apply a TodoStore.plan_merge result; see apply_merge."""
+        with self.ui.batch():
+            added, updated, skipped = self.store.apply_merge_plan(plan)
+            changed = added + updated
+            if changed:
+                self.record_changes([put_record(todo) for todo in changed])
+                self.update_todo_list()
+                self.notify_change("bulk")
+            
+            origin = f" from {os.path.basename(source)}" if source else ""
+            self.show_status_message(
+                f"✅ Merged{origin}: {len(added)} added, {len(updated)} updated, {skipped} skipped",
+                ft.colors.GREEN_700
+            )
+        return len(added), len(updated), skipped
+    
+    def show_import_error(self, ex: Exception):
+        """Report a failed import."""
+        if isinstance(ex, json.JSONDecodeError):
+            self.show_status_message(f"❌ Invalid JSON file: {str(ex)}", ft.colors.RED_700)
+        else:
             self.show_status_message(f"❌ Error importing: {str(ex)}", ft.colors.RED_700)
     
+    def show_import_progress(self, count: int, bytes_read: int, file_size: int):
+        """Show how far a running import has got."""
+        percent = int(bytes_read * 100 / file_size) if file_size else 100
+        self.status_message.value = f"⏳ Importing... {count} todos ({percent}%)"
+        self.status_message.color = ft.colors.BLUE_700
+        self.ui.mark(self.status_message)
+        # Send progress right away, even in the middle of a batch
+        self.ui.flush()
+    
+    def show_paste_progress(self, count: int, total: int):
+        """Show how far creating todos from a large paste has got."""
+        self.status_message.value = f"⏳ Adding... {count} of {total} todos"
+        self.status_message.color = ft.colors.BLUE_700
+        self.ui.mark(self.status_message)
+        self.ui.flush()
+    
     def show_status_message(self, message: str, color=None):
         """Display a status message to the user."""
         if color is None:
             color = ft.colors.GREEN_700
-        self.status_message.value = message
-        self.status_message.color = color
-        self.page.update()
-        
-        # Clear message after 5 seconds
-        import threading
-        def clear_message():
-            import time
-            time.sleep(5)
-            self.status_message.value = ""
-            self.page.update()
+        with self.ui.batch():
+            self.status_message.value = message
+            self.status_message.color = color
+            self.ui.mark(self.status_message)
         
-        thread = threading.Thread(target=clear_message, daemon=True)
-        thread.start()
+        # Clear the message later; a newer message replaces this timer
+        self.timers.call_later(
+            self.STATUS_MESSAGE_DURATION,
+            self.clear_status_message,
+            key=(self, "status")
+        )
+    
+    def clear_status_message(self):
+        """Clear the status message (runs on the timer thread)."""
+        with self.ui.batch():
+            self.status_message.value = ""
+            self.ui.mark(self.status_message)
 
 
-def main(page: ft.Page):
-    """Main application entry point."""
-    TodoApp(page)
+def main(page: ft.Page, db_path: str = None):
+    """Main application entry point.
+    
+    Todos are kept in the browser's localStorage, or in the SQLite
+    database at db_path when one is given.
+    """
+    storage = SQLiteBackend(db_path) if db_path else None
+    TodoApp(page, storage=storage)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Async variant of the Flet Todo List Application.
+
+AsyncTodoApp runs its event handlers as coroutines on Flet's asyncio event
+loop instead of on Flet's handler thread pool. In-memory changes stay on the
+loop (they are cheap), while file reading and writing, JSON parsing and
+storage round trips are awaited via asyncio.to_thread or client_storage's
+async calls, so a slow import in one session never holds up the handlers
+of the other sessions served by the same process.
+
+Start it with ``python run.py --async`` or ``python main.py --async``.
+"""
+
+import asyncio
+
+import flet as ft
+
+from todo_app import TodoApp
+from todo_storage import SQLiteBackend, StorageBackend, WriteBehindSaver
+from timer_scheduler import TimerScheduler
+
+
+class AsyncTodoApp(TodoApp):
+    """TodoApp whose handlers are coroutines.
+
+    Todos are loaded by start(), which must be awaited after construction.
+    """
+
+    def __init__(self, page: ft.Page, page_size: int = TodoApp.PAGE_SIZE,
+                 save_delay: float = WriteBehindSaver.SAVE_DELAY,
+                 storage: StorageBackend = None, timers: TimerScheduler = None):
+        # client_storage writes wait for the client's reply, which never
+        # arrives while the loop is blocked, so saves must stay on the timer thread
+        if save_delay <= 0:
+            raise ValueError("AsyncTodoApp needs a positive save_delay")
+        super().__init__(page, page_size, save_delay, storage, timers)
+
+    async def start(self):
+        """Load todos from the storage backend and render them."""
+        try:
+            todos = await self.storage.load_async()
+        except Exception as e:
+            print(f"Error loading todos: {e}")
+            todos = []
+        with self.ui.batch():
+            self.store.replace(todos)
+            self.reset_render_window()
+            self.update_todo_list()
+
+    def load_todos(self):
+        """Loading is asynchronous and done by start()."""
+
+    async def add_todo(self, e=None):
+        """Add a new todo item."""
+        super().add_todo(e)
+
+    async def on_checkbox_change(self, e):
+        """Toggle the todo whose checkbox was clicked."""
+        super().on_checkbox_change(e)
+
+    async def on_delete_click(self, e):
+        """Delete the todo whose delete button was clicked."""
+        super().on_delete_click(e)
+
+    async def on_row_click(self, e):
+        """Toggle the selection of the clicked row."""
+        super().on_row_click(e)
+
+    async def on_row_long_press(self, e):
+        """Select all todos between the last clicked row and this one."""
+        super().on_row_long_press(e)
+
+    async def select_all(self, e=None):
+        """Select every todo."""
+        super().select_all(e)
+
+    async def clear_selection(self, e=None):
+        """Deselect all todos."""
+        super().clear_selection(e)
+
+    async def complete_selected(self, e=None) -> int:
+        """Mark the selected todos completed."""
+        return super().complete_selected(e)
+
+    async def uncomplete_selected(self, e=None) -> int:
+        """Mark the selected todos pending again."""
+        return super().uncomplete_selected(e)
+
+    async def delete_selected(self, e=None) -> int:
+        """Delete the selected todos."""
+        return super().delete_selected(e)
+
+    async def clear_completed(self, e=None) -> int:
+        """Delete all completed todos."""
+        return super().clear_completed(e)
+
+    async def on_search_change(self, e):
+        """Update the listed todos as the search box is typed in."""
+        super().on_search_change(e)
+
+    async def on_filter_select(self, e):
+        """Switch the status filter to the chip that was clicked."""
+        super().on_filter_select(e)
+
+    async def on_todo_list_scroll(self, e: ft.OnScrollEvent):
+        """Slide the rendered rows along when the list is scrolled close to either end."""
+        super().on_todo_list_scroll(e)
+
+    async def flush_saves(self, e=None):
+        """Write queued changes to the storage backend on a worker thread."""
+        await asyncio.to_thread(self.saver.flush)
+
+    async def close_session(self, e=None):
+        """Write queued changes and close the storage backend on a worker thread."""
+        await asyncio.to_thread(super().close_session, e)
+
+    async def export_todos_dialog(self, e=None):
+        """Open file picker dialog to export todos to JSON."""
+        super().export_todos_dialog(e)
+
+    async def import_todos_dialog(self, e=None):
+        """Open file picker dialog to import todos from JSON."""
+        super().import_todos_dialog(e)
+
+    async def merge_todos_dialog(self, e=None):
+        """Open file picker dialog to merge todos from JSON."""
+        super().merge_todos_dialog(e)
+
+    async def file_picker_result(self, e: ft.FilePickerResultEvent):
+        """Handle file picker result for import, merge and export."""
+        operation, self.current_operation = self.current_operation, None
+        if operation == "export":
+            await self.export_todos_to_file(e)
+        elif operation == "import":
+            await self.import_todos_from_file(e)
+        elif operation == "merge":
+            await self.merge_todos_from_file(e)
+
+    async def export_todos_to_file(self, e: ft.FilePickerResultEvent):
+        """Export the current todos to a JSON file written on a worker thread."""
+        if not e.path:
+            self.show_status_message("Export cancelled", ft.colors.GREY_600)
+            return
+        indent = None if self.compact_export.value else 2
+        await asyncio.to_thread(self.write_export, e.path, self.todos, indent)
+
+    async def import_todos_from_file(self, e: ft.FilePickerResultEvent):
+        """Import todos from a JSON file parsed on a worker thread."""
+        try:
+            if e.files and len(e.files) > 0:
+                file_path = e.files[0].path
+                imported = await asyncio.to_thread(self.read_import_file, file_path)
+                self.apply_import(imported, file_path)
+            else:
+                self.show_status_message("Import cancelled", ft.colors.GREY_600)
+        except Exception as ex:
+            self.show_import_error(ex)
+
+    async def merge_todos_from_file(self, e: ft.FilePickerResultEvent):
+        """Merge todos from a JSON file parsed and matched on a worker thread.
+
+        The merge is planned against a copy of the todos; only applying
+        the result runs on the event loop.
+        """
+        try:
+            if e.files and len(e.files) > 0:
+                file_path = e.files[0].path
+                incoming = await asyncio.to_thread(self.read_merge_file, file_path)
+                plan = await asyncio.to_thread(self.store.plan_merge, incoming, list(self.store))
+                self.apply_merge_plan(plan, file_path)
+            else:
+                self.show_status_message("Merge cancelled", ft.colors.GREY_600)
+        except Exception as ex:
+            self.show_import_error(ex)
+
+
+async def main_async(page: ft.Page, db_path: str = None):
+    """Async application entry point (see todo_app.main)."""
+    storage = SQLiteBackend(db_path) if db_path else None
+    app = AsyncTodoApp(page, storage=storage)
+    await app.start()
+
+
+if __name__ == "__main__":
+    ft.app(target=main_async, view=ft.WEB_BROWSER)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Shared-list variant of the Flet Todo List Application.
+
+By default every browser session builds its own TodoApp over todos loaded
+from that browser's localStorage. With ``python run.py --shared`` all
+sessions served by the process attach to one SharedTodoStore instead: the
+todos are loaded once from a server-side backend (SQLite) and kept in a
+single TodoStore, and changes are saved once through a single saver.
+
+A change made in one session is rendered there right away and broadcast
+to the other sessions over page.pubsub as a small delta naming the
+operation, the todo id and the display positions touched. Receiving
+sessions skip deltas that fall outside their rendered rows and otherwise
+reconcile just their rendered rows by id against the shared store.
+"""
+
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+import flet as ft
+
+from timer_scheduler import TimerScheduler
+from todo_app import TodoApp
+from todo_storage import SQLiteBackend, StorageBackend, WriteBehindSaver
+from todo_store import TodoStore
+
+
+class SharedTodoStore:
+    """Todos, persistence and a lock shared by all sessions in the process."""
+
+    # PubSub topic the change deltas are sent on
+    TOPIC = "todos"
+
+    def __init__(self, storage: StorageBackend, save_delay: float = WriteBehindSaver.SAVE_DELAY,
+                 timers: TimerScheduler = None, topic: str = TOPIC):
+        self.storage = storage
+        self.saver = WriteBehindSaver(storage, save_delay, timers)
+        self.store = TodoStore()
+        self.topic = topic
+        # Held while any session reads or changes the store
+        self.lock = threading.RLock()
+        self.loaded = False
+
+    def load(self):
+        """Load the todos from the backend, once for all sessions."""
+        with self.lock:
+            if self.loaded:
+                return
+            try:
+                self.store.replace(self.storage.load())
+            except Exception as e:
+                print(f"Error loading todos: {e}")
+            self.loaded = True
+
+
+class SharedTodoApp(TodoApp):
+    """TodoApp session attached to a SharedTodoStore."""
+
+    def __init__(self, page: ft.Page, shared: SharedTodoStore, page_size: int = TodoApp.PAGE_SIZE):
+        self.shared = shared
+        super().__init__(page, page_size, storage=shared.storage)
+        self.saver = shared.saver
+        self.page.pubsub.subscribe_topic(shared.topic, self.on_shared_change)
+
+    @contextmanager
+    def synced(self) -> Iterator[None]:
+        """Batch UI updates while holding the shared lock.
+
+        An import in another session replaces the shared store object; the
+        first synced block afterwards switches to it and re-renders.
+        """
+        with self.ui.batch(), self.shared.lock:
+            if self.store is not self.shared.store:
+                self.store = self.shared.store
+                self.reset_render_window()
+                self.update_todo_list()
+            yield
+
+    def load_todos(self):
+        """Attach to the shared todos, loading them if this is the first session."""
+        self.shared.load()
+        self.store = self.shared.store
+
+    def build_ui(self):
+        with self.shared.lock:
+            super().build_ui()
+
+    def add_todo(self, e=None):
+        with self.synced():
+            super().add_todo(e)
+
+    def add_todos(self, names):
+        with self.synced():
+            return super().add_todos(names)
+
+    def toggle_todo_completed(self, todo_id: str):
+        with self.synced():
+            super().toggle_todo_completed(todo_id)
+
+    def delete_todo(self, todo_id: str):
+        with self.synced():
+            super().delete_todo(todo_id)
+
+    def set_completed(self, todo_ids, completed: bool = True) -> int:
+        with self.synced():
+            return super().set_completed(todo_ids, completed)
+
+    def delete_todos(self, todo_ids) -> int:
+        with self.synced():
+            return super().delete_todos(todo_ids)
+
+    def select(self, todo_ids, selected: bool = True):
+        with self.synced():
+            super().select(todo_ids, selected)
+
+    def set_search_query(self, query: str):
+        with self.synced():
+            super().set_search_query(query)
+
+    def set_status_filter(self, status: str):
+        with self.synced():
+            super().set_status_filter(status)
+
+    def show_more_todos(self) -> int:
+        with self.synced():
+            return super().show_more_todos()
+    
+    def show_earlier_todos(self) -> int:
+        with self.synced():
+            return super().show_earlier_todos()
+
+    def close_session(self, e=None):
+        """Write queued changes; the shared backend outlives the session."""
+        self.flush_saves()
+
+    def export_todos_to_file(self, e: ft.FilePickerResultEvent):
+        with self.shared.lock:
+            return super().export_todos_to_file(e)
+
+    def apply_import(self, imported: TodoStore, file_path: str):
+        with self.synced():
+            self.shared.store = imported
+            super().apply_import(imported, file_path)
+
+    def apply_merge(self, incoming, source: str = "") -> tuple:
+        with self.synced():
+            return super().apply_merge(incoming, source)
+
+    def apply_merge_plan(self, plan: tuple, source: str = "") -> tuple:
+        with self.synced():
+            return super().apply_merge_plan(plan, source)
+
+    def notify_change(self, op: str, todo_id: str = None, indices: tuple = ()):
+        """Broadcast a change made in this session to the other sessions."""
+        self.page.pubsub.send_others_on_topic(
+            self.shared.topic, {"op": op, "id": todo_id, "indices": list(indices)}
+        )
+
+    def on_shared_change(self, topic: str, change: Dict[str, Any]):
+        """Apply a change broadcast by another session."""
+        with self.synced():
+            if change["op"] in ("delete", "bulk", "replace") and self.selected:
+                # Forget selected todos that another session deleted
+                self.selected = {todo_id for todo_id in self.selected if todo_id in self.store}
+                self.update_selection_text()
+            if not self.outside_render_window(change["indices"]):
+                self.update_todo_list()
+
+    def outside_render_window(self, indices) -> bool:
+        """Whether a change at these positions leaves the rendered rows as they are.
+
+        Positions past a full render window only shift todos that are not
+        rendered. Bulk changes and replacements carry no positions, and
+        positions say nothing about a filtered list, so those always count
+        as touching the rendered rows. Deltas are handled in
+        any order, so the rows are always reconciled against the current
+        store rather than patched.
+        """
+        return (bool(indices) and not self.filtered and len(self.todo_rows) >= self.render_limit
+                and min(indices) >= self.render_start + self.render_limit)
+
+
+def main_shared(page: ft.Page, shared: SharedTodoStore):
+    """Entry point for a session attached to the shared todos."""
+    SharedTodoApp(page, shared)
+
+
+def shared_target(db_path: str):
+    """ft.app target serving one shared list stored in the SQLite database at db_path."""
+    return functools.partial(main_shared, shared=SharedTodoStore(SQLiteBackend(db_path)))
+
+
+if __name__ == "__main__":
+    ft.app(target=shared_target("todos.db"), view=ft.WEB_BROWSER)
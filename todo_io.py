@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON import and export for the Flet Todo List Application.
+
+Export files are a single JSON array of todo objects. They are parsed and
+written one element at a time so that memory use is bounded by the chunk
+size and the current batch, not by the size of the file.
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from todo_store import TodoItem
+
+# Bytes read from (or characters written to) the file at a time
+CHUNK_SIZE = 64 * 1024
+
+# Todos converted and handed to the caller at a time
+BATCH_SIZE = 1000
+
+# Largest single array element, in characters, read before giving up on it
+MAX_ELEMENT_SIZE = 1024 * 1024
+
+# Characters at the end of the buffer that may hold the start of a cut-off
+# token, e.g. "-Infinity" or "\uXXXX"
+_TOKEN_TAIL = 16
+
+_REQUIRED_FIELDS = ("id", "name", "creation_time", "completed")
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[Any, int]]:
+    """Yield the elements of a top-level JSON array read from a binary file.
+
+    Each element is yielded with the number of bytes read so far, which
+    callers can use for progress reporting.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pos = 0
+    bytes_read = 0
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, bytes_read, eof
+        if eof:
+            return False
+        chunk = f.read(chunk_size)
+        bytes_read += len(chunk)
+        eof = not chunk
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+        return True
+
+    def next_token() -> str:
+        # Skip whitespace and return the next character, reading as needed
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                raise ValueError("Invalid JSON format: unexpected end of file")
+
+    if next_token() != "[":
+        raise ValueError("Invalid JSON format: expected a list of todos")
+    pos += 1
+
+    if next_token() == "]":
+        pos += 1
+    else:
+        while True:
+            next_token()
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    # Only an element cut off at the end of the buffer can be
+                    # completed by reading on; any other error is in the file
+                    cut_off = e.msg.startswith("Unterminated string") or len(buffer) - e.pos <= _TOKEN_TAIL
+                    if not cut_off:
+                        raise
+                    if len(buffer) - pos > MAX_ELEMENT_SIZE:
+                        raise ValueError(
+                            f"Invalid JSON format: element larger than {MAX_ELEMENT_SIZE} characters"
+                        ) from e
+                    if read_more():
+                        continue
+                    raise
+                if len(buffer) - end <= _TOKEN_TAIL and read_more():
+                    # A number could continue in the next chunk ("1.5" of
+                    # "1.5e3" also decodes); decode again
+                    continue
+                break
+            pos = end
+            yield element, bytes_read
+
+            token = next_token()
+            pos += 1
+            if token == "]":
+                break
+            if token != ",":
+                raise ValueError(f"Invalid JSON format: expected ',' or ']' but found {token!r}")
+
+    while True:
+        if buffer[pos:].strip(_WHITESPACE):
+            raise ValueError("Invalid JSON format: unexpected data after the list of todos")
+        pos = len(buffer)
+        if not read_more():
+            return
+
+
+def validate_todo(data: Any, index: int) -> Dict[str, Any]:
+    """Check that an imported element looks like a serialized TodoItem."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid todo at position {index}: expected an object")
+    missing = [field for field in _REQUIRED_FIELDS if field not in data]
+    if missing:
+        raise ValueError(f"Invalid todo at position {index}: missing {', '.join(missing)}")
+    return data
+
+
+def iter_todo_batches(f: BinaryIO, batch_size: int = BATCH_SIZE,
+                      chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[List[TodoItem], int]]:
+    """Yield validated TodoItems from an export file in batches.
+
+    Each batch is yielded with the number of bytes read so far.
+    """
+    batch: List[TodoItem] = []
+    bytes_read = 0
+    for index, (data, bytes_read) in enumerate(iter_json_array(f, chunk_size)):
+        batch.append(TodoItem.from_dict(validate_todo(data, index)))
+        if len(batch) >= batch_size:
+            yield batch, bytes_read
+            batch = []
+    if batch:
+        yield batch, bytes_read
+
+
+def write_todos(f: TextIO, todos: Iterable[TodoItem], indent: Optional[int] = 2,
+                progress: Callable[[int], None] = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Write todos to a text file as a JSON array, one buffered chunk at a time.
+
+    The output matches ``json.dumps(..., indent=indent, ensure_ascii=False)``;
+    with ``indent=None`` it is written without any whitespace. `progress` is
+    called with the number of todos written after every chunk. Returns the
+    number of todos written.
+    """
+    if indent is None:
+        separator, closing = ",", "]"
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    else:
+        pad = " " * indent
+        separator, closing = ",\n" + pad, "\n]"
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+
+        def encode(data):
+            return encoder.encode(data).replace("\n", "\n" + pad)
+
+    buffer: List[str] = ["[" if indent is None else "[\n" + pad]
+    buffered = 0
+    count = 0
+    for todo in todos:
+        if count:
+            buffer.append(separator)
+        text = encode(todo.to_dict())
+        buffer.append(text)
+        buffered += len(text)
+        count += 1
+        if buffered >= chunk_size:
+            f.write("".join(buffer))
+            buffer, buffered = [], 0
+            if progress:
+                progress(count)
+
+    if not count:
+        buffer = ["[]"]
+    else:
+        buffer.append(closing)
+    f.write("".join(buffer))
+    if progress:
+        progress(count)
+    return count
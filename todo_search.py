@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Search index for the Flet Todo List Application.
+
+TodoStore keeps a SearchIndex up to date as todos are added and removed:
+an inverted index from each lower-cased word of a todo's name to the ids
+of the todos containing it, plus a sorted list of all words so that the
+words starting with a prefix are found by binary search. A query matches
+the todos containing, for every query word, some word starting with it
+("buy mi" finds "Buy milk").
+"""
+
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased words."""
+    return _WORD.findall(text.casefold())
+
+
+class SearchIndex:
+    """Inverted word index over todo names with prefix lookup."""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        # Sorted vocabulary for prefix lookup; None while it needs rebuilding
+        self._words: Optional[List[str]] = []
+
+    def __len__(self) -> int:
+        """Number of distinct words."""
+        return len(self._postings)
+
+    def add(self, todo_id: str, name: str):
+        """Index a todo's name."""
+        for word in tokenize(name):
+            ids = self._postings.get(word)
+            if ids is None:
+                self._postings[word] = {todo_id}
+                if self._words is not None:
+                    insort(self._words, word)
+            else:
+                ids.add(todo_id)
+
+    def add_many(self, todos: Iterable):
+        """Index a batch of todos; the vocabulary is re-sorted lazily."""
+        postings = self._postings
+        for todo in todos:
+            for word in tokenize(todo.name):
+                ids = postings.get(word)
+                if ids is None:
+                    postings[word] = {todo.id}
+                    self._words = None
+                else:
+                    ids.add(todo.id)
+
+    def remove(self, todo_id: str, name: str):
+        """Remove a todo's name from the index."""
+        for word in tokenize(name):
+            ids = self._postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(todo_id)
+            if not ids:
+                del self._postings[word]
+                if self._words is not None:
+                    del self._words[bisect_left(self._words, word)]
+
+    def clear(self):
+        self._postings = {}
+        self._words = []
+
+    def prefix_postings(self, prefix: str) -> List[Set[str]]:
+        """Id sets of all words starting with prefix."""
+        if self._words is None:
+            self._words = sorted(self._postings)
+        words = self._words
+        postings = []
+        index = bisect_left(words, prefix)
+        while index < len(words) and words[index].startswith(prefix):
+            postings.append(self._postings[words[index]])
+            index += 1
+        return postings
+
+    def search(self, query: str) -> Optional[Set[str]]:
+        """Ids of the todos matching every word of query.
+
+        Returns None when the query has no words (everything matches).
+        """
+        words = set(tokenize(query))
+        if not words:
+            return None
+        candidates = [self.prefix_postings(word) for word in words]
+        # Start from the word with the fewest matches, then narrow it down
+        candidates.sort(key=lambda postings: sum(map(len, postings)))
+        result: Set[str] = set().union(*candidates[0])
+        for postings in candidates[1:]:
+            if not result:
+                break
+            if len(result) * len(postings) <= sum(map(len, postings)):
+                # Few candidates left: test each against the word's id sets
+                result = {todo_id for todo_id in result if any(todo_id in ids for ids in postings)}
+            else:
+                result &= set().union(*postings)
+        return result
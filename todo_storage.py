@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Persistence backends for the Flet Todo List Application.
+
+Backends receive change records describing single todo mutations. A change
+record is either ``{"op": "put", "todo": {...}}`` (add or update) or
+``{"op": "delete", "id": "..."}``. Both are idempotent, so replaying a
+record twice gives the same result.
+
+ClientStorageJournal (default) stores todos in page.client_storage as a
+snapshot plus a journal of changes:
+
+- ``todos``             JSON list of all todos at the last compaction
+- ``todos.journal``     number of journal entries written since then
+- ``todos.journal.<n>`` JSON list of change records
+
+SQLiteBackend stores one row per todo in a local SQLite database, for
+desktop and server deployments.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from timer_scheduler import TimerScheduler, default_scheduler
+from todo_store import TodoItem
+
+
+def put_record(todo: TodoItem) -> Dict[str, Any]:
+    """Change record for an added or updated todo."""
+    return {"op": "put", "todo": todo.to_dict()}
+
+
+def delete_record(todo_id: str) -> Dict[str, Any]:
+    """Change record for a deleted todo."""
+    return {"op": "delete", "id": todo_id}
+
+
+class StorageBackend:
+    """Interface of todo persistence backends."""
+
+    def load(self) -> List[TodoItem]:
+        """Return all stored todos."""
+        raise NotImplementedError
+
+    async def load_async(self) -> List[TodoItem]:
+        """Return all stored todos without blocking the event loop."""
+        return await asyncio.to_thread(self.load)
+
+    def apply(self, records: List[Dict[str, Any]]):
+        """Persist a batch of change records."""
+        raise NotImplementedError
+
+    def write_snapshot(self, todos: List[TodoItem]):
+        """Replace all stored todos."""
+        raise NotImplementedError
+
+    def needs_compaction(self) -> bool:
+        """Whether a full snapshot should be written to keep loading cheap."""
+        return False
+
+    def close(self):
+        """Release resources held by the backend."""
+
+
+class ClientStorageJournal(StorageBackend):
+    """Snapshot + journal persistence on top of page.client_storage."""
+
+    # Most journal entries kept before compacting into a snapshot; loading
+    # reads each entry with its own client round trip
+    MAX_JOURNAL_ENTRIES = 50
+
+    def __init__(self, storage, key: str = "todos", max_entries: int = MAX_JOURNAL_ENTRIES):
+        self.storage = storage
+        self.key = key
+        self.max_entries = max_entries
+        self.journal_length = 0
+        self.journal_bytes = 0
+        self.snapshot_bytes = 0
+
+    def entry_key(self, index: int) -> str:
+        return f"{self.key}.journal.{index}"
+
+    def load(self) -> List[TodoItem]:
+        """Read the snapshot and replay the journal on top of it."""
+        snapshot = self.storage.get(self.key)
+        length = self.storage.get(f"{self.key}.journal") or 0
+        entries = [self.storage.get(self.entry_key(index)) for index in range(length)]
+        return self.restore(snapshot, length, entries)
+
+    async def load_async(self) -> List[TodoItem]:
+        """Like load(), using client_storage's async calls.
+
+        Parsing and replaying run on a worker thread.
+        """
+        snapshot = await self.storage.get_async(self.key)
+        length = await self.storage.get_async(f"{self.key}.journal") or 0
+        entries = [await self.storage.get_async(self.entry_key(index)) for index in range(length)]
+        return await asyncio.to_thread(self.restore, snapshot, length, entries)
+
+    def restore(self, snapshot: Optional[str], length: int, entries: List[Optional[str]]) -> List[TodoItem]:
+        """Build the todos from a stored snapshot and journal entries."""
+        todos: Dict[str, Dict[str, Any]] = {}
+        if snapshot:
+            for data in json.loads(snapshot):
+                todos[data["id"]] = data
+        self.snapshot_bytes = len(snapshot or "")
+
+        self.journal_length = length
+        self.journal_bytes = 0
+        for entry in entries:
+            if not entry:
+                continue
+            self.journal_bytes += len(entry)
+            for record in json.loads(entry):
+                if record["op"] == "put":
+                    todos[record["todo"]["id"]] = record["todo"]
+                elif record["op"] == "delete":
+                    todos.pop(record["id"], None)
+
+        return [TodoItem.from_dict(data) for data in todos.values()]
+
+    def apply(self, records: List[Dict[str, Any]]):
+        """Write one journal entry holding the given change records."""
+        if not records:
+            return
+        entry = json.dumps(records)
+        self.storage.set(self.entry_key(self.journal_length), entry)
+        self.journal_length += 1
+        self.journal_bytes += len(entry)
+        self.storage.set(f"{self.key}.journal", self.journal_length)
+
+    def needs_compaction(self) -> bool:
+        """Whether replaying the journal has become costlier than rewriting the snapshot.
+
+        Compacting once the journal holds as many bytes as the snapshot
+        keeps the amortized write cost per change constant, and the entry
+        limit keeps the number of round trips on load (and on compaction)
+        bounded however large the list is.
+        """
+        if self.journal_length >= self.max_entries:
+            return True
+        return self.snapshot_bytes > 0 and self.journal_bytes >= self.snapshot_bytes
+
+    def write_snapshot(self, todos: List[TodoItem]):
+        """Store all todos as the new snapshot and drop the journal."""
+        snapshot = json.dumps([todo.to_dict() for todo in todos])
+        self.storage.set(self.key, snapshot)
+        self.snapshot_bytes = len(snapshot)
+        for index in range(self.journal_length):
+            self.storage.remove(self.entry_key(index))
+        self.journal_length = 0
+        self.journal_bytes = 0
+        self.storage.set(f"{self.key}.journal", 0)
+
+
+class SQLiteBackend(StorageBackend):
+    """One row per todo in a local SQLite database (WAL mode).
+
+    Changes become single-row upserts and deletes, and todos are read in
+    pages in display order, so no single giant string is ever built.
+    Pages are keyed on (completed, creation_time, id), a total order that
+    the todos_display_order index serves directly, so each page costs the
+    same however deep into the table it starts.
+    """
+
+    # Rows fetched per query when loading
+    LOAD_PAGE_SIZE = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Writes come from the saver thread, loads from the UI thread
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS todos ("
+                "id TEXT PRIMARY KEY, "
+                "name TEXT NOT NULL, "
+                "creation_time TEXT NOT NULL, "
+                "completed INTEGER NOT NULL, "
+                "modified_time TEXT)"
+            )
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(todos)")]
+            if "modified_time" not in columns:
+                # Databases created before modification times were recorded
+                self.conn.execute("ALTER TABLE todos ADD COLUMN modified_time TEXT")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS todos_display_order "
+                "ON todos (completed, creation_time, id)"
+            )
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM todos").fetchone()[0]
+
+    def load_page(self, after: Optional[Tuple[int, str, str]], limit: int) -> List[TodoItem]:
+        """Return `limit` todos in display order.
+
+        `after` is the stored (completed, creation_time, id) key of the
+        todo the page follows, or None for the first page.
+        """
+        return [self._todo(row) for row in self._select_page(after, limit)]
+
+    def iter_pages(self, page_size: int = LOAD_PAGE_SIZE) -> Iterator[List[TodoItem]]:
+        """Yield all todos in display order, one page at a time."""
+        after = None
+        while True:
+            rows = self._select_page(after, page_size)
+            if not rows:
+                return
+            yield [self._todo(row) for row in rows]
+            # Continue from the stored key, not one rebuilt from a TodoItem
+            todo_id, _, creation_time, completed, _ = rows[-1]
+            after = (completed, creation_time, todo_id)
+
+    def _select_page(self, after: Optional[Tuple[int, str, str]], limit: int) -> List[tuple]:
+        with self._lock:
+            if after is None:
+                return self.conn.execute(
+                    "SELECT id, name, creation_time, completed, modified_time FROM todos "
+                    "ORDER BY completed, creation_time, id LIMIT ?",
+                    (limit,)
+                ).fetchall()
+            return self.conn.execute(
+                "SELECT id, name, creation_time, completed, modified_time FROM todos "
+                "WHERE (completed, creation_time, id) > (?, ?, ?) "
+                "ORDER BY completed, creation_time, id LIMIT ?",
+                (*after, limit)
+            ).fetchall()
+
+    @staticmethod
+    def _todo(row: tuple) -> TodoItem:
+        todo_id, name, creation_time, completed, modified_time = row
+        return TodoItem.from_dict({
+            "id": todo_id, "name": name, "creation_time": creation_time,
+            "completed": bool(completed), "modified_time": modified_time
+        })
+
+    def load(self) -> List[TodoItem]:
+        todos = []
+        for page in self.iter_pages():
+            todos.extend(page)
+        return todos
+
+    def apply(self, records: List[Dict[str, Any]]):
+        if not records:
+            return
+        with self._lock, self.conn:
+            for record in records:
+                if record["op"] == "put":
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO todos (id, name, creation_time, completed, modified_time) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        self._row(record["todo"])
+                    )
+                elif record["op"] == "delete":
+                    self.conn.execute("DELETE FROM todos WHERE id = ?", (record["id"],))
+
+    def write_snapshot(self, todos: List[TodoItem]):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM todos")
+            self.conn.executemany(
+                "INSERT INTO todos (id, name, creation_time, completed, modified_time) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self._row(todo.to_dict()) for todo in todos)
+            )
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @staticmethod
+    def _row(data: Dict[str, Any]):
+        return (data["id"], data["name"], data["creation_time"], int(data["completed"]),
+                data.get("modified_time"))
+
+
+def _run_in_thread(func: Callable[[], Any]):
+    threading.Thread(target=func, daemon=True).start()
+
+
+class WriteBehindSaver:
+    """Coalesces backend writes and performs them off the UI thread.
+
+    Change records are buffered and written as a single batch once
+    no new change arrived for `delay` seconds. The timer only starts the
+    write: it is handed to `run` (e.g. ``page.run_thread``, by default a
+    new thread), so a slow client does not hold up the timers of every
+    other session. A requested snapshot replaces
+    the buffered records, since it already contains their effect. Changes
+    whose write fails stay buffered and are retried after RETRY_DELAY
+    seconds. With a delay of 0 every call writes immediately on the
+    calling thread (and a failed write is retried with the next one).
+    """
+
+    # Quiet period in seconds before buffered changes are written
+    SAVE_DELAY = 0.5
+
+    # Seconds before a failed write is tried again
+    RETRY_DELAY = 5
+
+    def __init__(self, backend: StorageBackend, delay: float = SAVE_DELAY,
+                 timers: TimerScheduler = None, run: Callable[[Callable[[], Any]], Any] = None):
+        self.backend = backend
+        self.delay = delay
+        self.timers = timers or default_scheduler
+        self.run = run or _run_in_thread
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._records: List[Dict[str, Any]] = []
+        self._snapshot: Optional[List[TodoItem]] = None
+        # Saves requested (add/request_snapshot calls) and backend writes
+        # performed, failed, and failed but buffered again for a retry
+        self.requested = 0
+        self.performed = 0
+        self.failed = 0
+        self.retried = 0
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that have not been written yet."""
+        return bool(self._records) or self._snapshot is not None
+
+    @property
+    def snapshot_pending(self) -> bool:
+        return self._snapshot is not None
+
+    def add(self, records: List[Dict[str, Any]]):
+        """Buffer change records for the next write."""
+        with self._lock:
+            self._records.extend(records)
+            self.requested += 1
+        self._schedule()
+
+    def request_snapshot(self, todos: List[TodoItem]):
+        """Buffer a full snapshot; `todos` must be a list owned by the caller."""
+        with self._lock:
+            self._snapshot = todos
+            self._records = []
+            self.requested += 1
+        self._schedule()
+
+    def flush(self):
+        """Write everything buffered now."""
+        self.timers.cancel(self)
+        with self._write_lock:
+            with self._lock:
+                snapshot, self._snapshot = self._snapshot, None
+                records, self._records = self._records, []
+            if snapshot is None and not records:
+                return
+            try:
+                if snapshot is not None:
+                    self.backend.write_snapshot(snapshot)
+                    snapshot = None
+                self.backend.apply(records)
+            except Exception as e:
+                print(f"Error saving todos: {e}")
+                self._requeue(snapshot, records)
+                return
+            with self._lock:
+                self.performed += 1
+
+    def _requeue(self, snapshot: Optional[List[TodoItem]], records: List[Dict[str, Any]]):
+        # The journal only holds changes, so unwritten ones must not be
+        # dropped: put them back in front of anything buffered since
+        with self._lock:
+            self.failed += 1
+            if self._snapshot is None:
+                # (a snapshot requested since already contains their effect)
+                if snapshot is not None:
+                    self._snapshot = snapshot
+                self._records = records + self._records
+                self.retried += 1
+        if self.delay > 0:
+            self.timers.call_later(max(self.delay, self.RETRY_DELAY), self._start_flush, key=self)
+
+    def _start_flush(self):
+        # Runs on the shared timer thread, which must not wait on a client
+        self.run(self.flush)
+
+    def _schedule(self):
+        if self.delay <= 0:
+            self.flush()
+            return
+        # Restarting the timer keyed on this saver cancels the previous one
+        self.timers.call_later(self.delay, self._start_flush, key=self)
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Todo data model and in-memory store for the Flet Todo List Application.
+
+The store keeps todos indexed by id, by the words of their names (for
+search) and in display order (pending todos first, then completed ones,
+each ordered by creation time) so that the UI never has to scan or re-sort
+the whole list for a single change.
+"""
+
+import secrets
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from heapq import merge
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from todo_search import SearchIndex
+
+# Crockford base32 alphabet, ordered so that encoded ids sort like their values
+_ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ID_RANDOM_BITS = 80
+
+_id_lock = threading.Lock()
+_last_id_ms = -1
+_last_id_random = 0
+
+
+def new_todo_id(timestamp: float = None) -> str:
+    """Generate a ULID-style todo id.
+
+    Ids are 26 characters encoding a 48-bit millisecond timestamp followed
+    by 80 random bits, so string order is creation order and ids from
+    different sessions do not collide in practice. Ids for the current time
+    are strictly increasing within one process: in the same millisecond (or
+    if the clock went backwards) the last timestamp is reused and the random
+    part incremented. An explicit, older `timestamp` (e.g. for a todo being
+    imported) gets an id at that time instead.
+    """
+    global _last_id_ms, _last_id_random
+    ms = int((time.time() if timestamp is None else timestamp) * 1000)
+    with _id_lock:
+        if ms == _last_id_ms or (ms < _last_id_ms and timestamp is None):
+            ms = _last_id_ms
+            random_part = _last_id_random + 1
+            if random_part >> _ID_RANDOM_BITS:
+                ms += 1
+                random_part = secrets.randbits(_ID_RANDOM_BITS)
+        else:
+            random_part = secrets.randbits(_ID_RANDOM_BITS)
+        if ms >= _last_id_ms:
+            _last_id_ms, _last_id_random = ms, random_part
+
+    value = (ms << _ID_RANDOM_BITS) | random_part
+    chars = []
+    for _ in range(26):
+        chars.append(_ID_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+class TodoItem:
+    """Represents a single todo item with name, creation time, and completion status.
+
+    The creation and last modification times are stored as POSIX timestamps
+    (``created_at``, ``modified_at``); the ISO strings used in JSON are
+    derived from them, and the display string is formatted once and cached.
+    """
+
+    __slots__ = ("name", "created_at", "modified_at", "completed", "id", "_display_time")
+
+    def __init__(self, name: str, creation_time: str = None, completed: bool = False, todo_id: str = None,
+                 created_at: float = None, modified_at: float = None):
+        self.name = name
+        created_now = created_at is None and not creation_time
+        if created_now:
+            created_at = time.time()
+        elif created_at is None:
+            created_at = datetime.fromisoformat(creation_time).timestamp()
+        self.created_at = created_at
+        self.modified_at = created_at if modified_at is None else modified_at
+        self.completed = completed
+        self.id = todo_id or new_todo_id(None if created_now else created_at)
+        self._display_time = None
+
+    @property
+    def creation_time(self) -> str:
+        """Creation time as a local ISO 8601 string."""
+        return datetime.fromtimestamp(self.created_at).isoformat()
+
+    @property
+    def modified_time(self) -> str:
+        """Last modification time as a local ISO 8601 string."""
+        return datetime.fromtimestamp(self.modified_at).isoformat()
+
+    @property
+    def display_time(self) -> str:
+        """Creation time formatted for the todo list."""
+        if self._display_time is None:
+            self._display_time = datetime.fromtimestamp(self.created_at).strftime("%m/%d/%Y %H:%M")
+        return self._display_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert todo item to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "creation_time": self.creation_time,
+            "modified_time": self.modified_time,
+            "completed": self.completed
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TodoItem':
+        """Create todo item from dictionary.
+
+        Data written before modification times were recorded counts as
+        unmodified since creation.
+        """
+        modified_time = data.get("modified_time")
+        return cls(
+            name=data["name"],
+            creation_time=data["creation_time"],
+            completed=data["completed"],
+            todo_id=data["id"],
+            modified_at=datetime.fromisoformat(modified_time).timestamp() if modified_time else None
+        )
+
+    def touch(self):
+        """Record that the todo was just modified."""
+        self.modified_at = time.time()
+
+    def content_key(self) -> Tuple[str, str]:
+        """What makes two todos the same todo regardless of their ids."""
+        return (self.name.strip().casefold(), self.creation_time)
+
+
+class _Partition:
+    """Todos sharing one completion state, kept sorted by (created_at, id)."""
+
+    def __init__(self):
+        self.keys: List[Tuple[float, str]] = []
+        self.items: List[TodoItem] = []
+
+    def insert(self, todo: TodoItem) -> int:
+        key = TodoStore.sort_key(todo)
+        index = bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.items.insert(index, todo)
+        return index
+
+    def remove(self, todo: TodoItem) -> int:
+        index = bisect_left(self.keys, TodoStore.sort_key(todo))
+        del self.keys[index]
+        del self.items[index]
+        return index
+
+    def index(self, todo: TodoItem) -> int:
+        return bisect_left(self.keys, TodoStore.sort_key(todo))
+
+    def extend(self, todos: List[TodoItem]):
+        """Insert many todos, appending directly when they sort after the existing ones."""
+        if not todos:
+            return
+        todos.sort(key=TodoStore.sort_key)
+        keys = [TodoStore.sort_key(todo) for todo in todos]
+        if not self.keys or keys[0] > self.keys[-1]:
+            self.keys.extend(keys)
+            self.items.extend(todos)
+        else:
+            pairs = list(merge(zip(self.keys, self.items), zip(keys, todos), key=lambda p: p[0]))
+            self.keys = [key for key, _ in pairs]
+            self.items = [todo for _, todo in pairs]
+
+    def discard(self, todo_ids: Set[str]):
+        """Drop the todos with the given ids in one pass."""
+        kept = [(key, todo) for key, todo in zip(self.keys, self.items) if todo.id not in todo_ids]
+        if len(kept) != len(self.items):
+            self.keys = [key for key, _ in kept]
+            self.items = [todo for _, todo in kept]
+
+    def load(self, todos: List[TodoItem]):
+        todos.sort(key=TodoStore.sort_key)
+        self.items = todos
+        self.keys = [TodoStore.sort_key(todo) for todo in todos]
+
+
+class TodoStore:
+    """Owns the todo items with O(1) lookup by id and a sorted display index.
+
+    Display order is pending todos first, then completed todos, each by
+    creation time. Positions are found by binary search, so locating a todo
+    is O(log n); inserting or moving one shifts a list tail (a memmove).
+    """
+
+    def __init__(self, todos: Iterable[TodoItem] = ()):
+        self._by_id: Dict[str, TodoItem] = {}
+        self.search_index = SearchIndex()
+        self._pending = _Partition()
+        self._completed = _Partition()
+        self.replace(todos)
+
+    @staticmethod
+    def sort_key(todo: TodoItem) -> Tuple[float, str]:
+        """Order of a todo within its completion partition."""
+        return (todo.created_at, todo.id)
+
+    @staticmethod
+    def display_key(todo: TodoItem) -> Tuple[bool, float, str]:
+        """Order of a todo in the whole display."""
+        return (todo.completed, todo.created_at, todo.id)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, todo_id: str) -> bool:
+        return todo_id in self._by_id
+
+    def __iter__(self) -> Iterator[TodoItem]:
+        """Iterate todos in display order."""
+        yield from self._pending.items
+        yield from self._completed.items
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending.items)
+
+    @property
+    def completed_count(self) -> int:
+        return len(self._completed.items)
+
+    def view(self, completed: bool = None) -> Iterator[TodoItem]:
+        """Iterate todos in display order, optionally only pending or completed ones."""
+        if completed is None:
+            return iter(self)
+        return iter(self._partition_for(completed).items)
+
+    def search(self, query: str, completed: bool = None) -> Iterable[TodoItem]:
+        """Todos whose name matches query, in display order.
+
+        See SearchIndex.search for the matching rules; a query without
+        words matches every todo. completed optionally restricts the
+        result to pending or completed todos.
+        """
+        ids = self.search_index.search(query)
+        if ids is None:
+            return self.view(completed)
+        if len(ids) > len(self) // 8:
+            # Walking the sorted todos beats sorting a large result
+            return [todo for todo in self.view(completed) if todo.id in ids]
+        todos = [
+            todo for todo in map(self._by_id.__getitem__, ids)
+            if completed is None or todo.completed == completed
+        ]
+        todos.sort(key=self.display_key)
+        return todos
+
+    def completed_todos(self) -> List[TodoItem]:
+        """All completed todos in display order."""
+        return list(self._completed.items)
+
+    def get(self, todo_id: str) -> TodoItem:
+        """Return the todo with the given id, or None."""
+        return self._by_id.get(todo_id)
+
+    def at(self, index: int) -> TodoItem:
+        """Return the todo at a display position."""
+        pending = len(self._pending.items)
+        if index < pending:
+            return self._pending.items[index]
+        return self._completed.items[index - pending]
+
+    def index_of(self, todo_id: str) -> int:
+        """Return the display position of a todo."""
+        todo = self._by_id[todo_id]
+        return self._offset(todo) + self._partition(todo).index(todo)
+
+    def add(self, todo: TodoItem) -> int:
+        """Add a todo (replacing one with the same id) and return its display position."""
+        if todo.id in self._by_id:
+            self.remove(todo.id)
+        self._by_id[todo.id] = todo
+        self.search_index.add(todo.id, todo.name)
+        return self._offset(todo) + self._partition(todo).insert(todo)
+
+    def add_many(self, todos: Iterable[TodoItem]):
+        """Add a batch of todos, e.g. while streaming an import."""
+        batch: Dict[str, TodoItem] = {}
+        for todo in todos:
+            if todo.id in self._by_id:
+                self.remove(todo.id)
+            batch[todo.id] = todo
+        self._by_id.update(batch)
+        self.search_index.add_many(batch.values())
+        self._pending.extend([t for t in batch.values() if not t.completed])
+        self._completed.extend([t for t in batch.values() if t.completed])
+
+    def remove(self, todo_id: str) -> Tuple[TodoItem, int]:
+        """Remove a todo and return it with the display position it had."""
+        todo = self._by_id.pop(todo_id)
+        self.search_index.remove(todo.id, todo.name)
+        return todo, self._offset(todo) + self._partition(todo).remove(todo)
+
+    def toggle(self, todo_id: str) -> Tuple[TodoItem, int, int]:
+        """Flip the completion state of a todo.
+
+        Returns the todo with its old and new display positions.
+        """
+        todo = self._by_id[todo_id]
+        old_index = self._offset(todo) + self._partition(todo).remove(todo)
+        todo.completed = not todo.completed
+        todo.touch()
+        new_index = self._offset(todo) + self._partition(todo).insert(todo)
+        return todo, old_index, new_index
+
+    def remove_many(self, todo_ids: Iterable[str]) -> List[TodoItem]:
+        """Remove several todos with one pass over the display index.
+
+        Unknown ids are ignored. Returns the removed todos.
+        """
+        removed = [self._by_id.pop(todo_id) for todo_id in set(todo_ids) if todo_id in self._by_id]
+        if removed:
+            for todo in removed:
+                self.search_index.remove(todo.id, todo.name)
+            removed_ids = {todo.id for todo in removed}
+            self._pending.discard(removed_ids)
+            self._completed.discard(removed_ids)
+        return removed
+
+    def set_completed(self, todo_ids: Iterable[str], completed: bool) -> List[TodoItem]:
+        """Set the completion state of several todos at once.
+
+        Unknown ids and todos already in that state are ignored. Returns
+        the todos that changed.
+        """
+        changed = [
+            todo for todo in map(self._by_id.get, set(todo_ids))
+            if todo is not None and todo.completed != completed
+        ]
+        if changed:
+            source, target = (self._pending, self._completed) if completed else (self._completed, self._pending)
+            source.discard({todo.id for todo in changed})
+            for todo in changed:
+                todo.completed = completed
+                todo.touch()
+            target.extend(changed)
+        return changed
+
+    def merge(self, todos: Iterable[TodoItem]) -> Tuple[List[TodoItem], List[TodoItem], int]:
+        """Merge todos from another source, e.g. an export from another machine.
+
+        A todo is matched to an existing one by id, or else by content
+        (name and creation time), through hash lookups, so merging m todos
+        into n costs O(n + m). A new todo is added. A matched todo replaces
+        the existing one only if it was modified later and differs; it
+        keeps the existing id. Everything else is skipped. The changes are
+        applied to the store as one batch.
+
+        Returns the added todos, the updated todos and the number skipped.
+        """
+        return self.apply_merge_plan(self.plan_merge(todos))
+
+    def plan_merge(self, todos: Iterable[TodoItem],
+                   existing: Iterable[TodoItem] = None) -> Tuple[List[TodoItem], List[TodoItem], int]:
+        """Work out the changes merge() would make, without making them.
+
+        `existing` defaults to the todos in the store. Passing a copy of
+        them (``list(store)``) lets the plan be computed on another thread
+        while the store keeps changing; apply it with apply_merge_plan().
+
+        Returns the todos to add, the todos to update and the number skipped.
+        """
+        by_id = self._by_id if existing is None else {todo.id: todo for todo in existing}
+        by_content = {todo.content_key(): todo for todo in by_id.values()}
+        merged: Dict[str, TodoItem] = {}
+        added_ids: Set[str] = set()
+        skipped = 0
+        for todo in todos:
+            key = todo.content_key()
+            current = merged.get(todo.id) or by_id.get(todo.id) or by_content.get(key)
+            if current is None:
+                merged[todo.id] = todo
+                added_ids.add(todo.id)
+                by_content[key] = todo
+            elif todo.modified_at > current.modified_at and \
+                    (todo.name, todo.completed) != (current.name, current.completed):
+                if todo.id != current.id:
+                    todo = TodoItem(todo.name, completed=todo.completed, todo_id=current.id,
+                                    created_at=current.created_at, modified_at=todo.modified_at)
+                merged[todo.id] = todo
+                by_content[key] = todo
+            else:
+                skipped += 1
+
+        added = [todo for todo in merged.values() if todo.id in added_ids]
+        updated = [todo for todo in merged.values() if todo.id not in added_ids]
+        return added, updated, skipped
+
+    def apply_merge_plan(self, plan: Tuple[List[TodoItem], List[TodoItem], int]
+                         ) -> Tuple[List[TodoItem], List[TodoItem], int]:
+        """Apply a plan_merge() result to the store as one batch.
+
+        Changes made since the plan was computed win: a planned todo whose
+        id has been added meanwhile, or an update whose todo has been
+        deleted or modified later, is skipped. Returns the todos added, the
+        todos updated and the number skipped.
+        """
+        added, updated, skipped = plan
+        fresh_added = [todo for todo in added if todo.id not in self._by_id]
+        fresh_updated = [
+            todo for todo in updated
+            if todo.id in self._by_id and todo.modified_at > self._by_id[todo.id].modified_at
+        ]
+        skipped += len(added) - len(fresh_added) + len(updated) - len(fresh_updated)
+        self.remove_many(todo.id for todo in fresh_updated)
+        self.add_many(fresh_added + fresh_updated)
+        return fresh_added, fresh_updated, skipped
+
+    def replace(self, todos: Iterable[TodoItem]):
+        """Replace all todos, e.g. after loading or importing."""
+        self._by_id = {todo.id: todo for todo in todos}
+        self.search_index.clear()
+        self.search_index.add_many(self._by_id.values())
+        self._pending.load([t for t in self._by_id.values() if not t.completed])
+        self._completed.load([t for t in self._by_id.values() if t.completed])
+
+    def _partition(self, todo: TodoItem) -> _Partition:
+        return self._partition_for(todo.completed)
+
+    def _partition_for(self, completed: bool) -> _Partition:
+        return self._completed if completed else self._pending
+
+    def _offset(self, todo: TodoItem) -> int:
+        return len(self._pending.items) if todo.completed else 0
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Targeted UI updates for the Flet Todo List Application.
+
+Instead of calling page.update() (which diffs every control on the page),
+handlers mark the controls they changed and the scheduler sends them in a
+single page.update(*controls) call when the outermost batch ends.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+import flet as ft
+
+
+class UpdateScheduler:
+    """Collects changed controls and flushes them in one update."""
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self._dirty: Dict[int, ft.Control] = {}
+        self._depth = 0
+        # Held for the whole of a batch, so updates from other threads
+        # (timers, export progress) never interleave with a running handler
+        self._lock = threading.RLock()
+
+    def mark(self, *controls: ft.Control):
+        """Remember controls that need to be sent to the client."""
+        with self._lock:
+            for control in controls:
+                self._dirty[id(control)] = control
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes; the outermost batch flushes them when it ends."""
+        with self._lock:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.flush()
+
+    def flush(self):
+        """Send all marked controls now."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            # A control is diffed together with its descendants, so skip
+            # controls already covered by a dirty ancestor. Controls not on
+            # the page yet are sent when their parent is updated.
+            controls = [
+                control for control in dirty.values()
+                if control.uid is not None and not self._covered_by_ancestor(control, dirty)
+            ]
+            if controls:
+                self.page.update(*controls)
+
+    @staticmethod
+    def _covered_by_ancestor(control: ft.Control, dirty: Dict[int, ft.Control]) -> bool:
+        # Diffing does not descend into isolated controls, so an ancestor
+        # only covers the control if nothing on the way up is isolated
+        node = control
+        while node.parent is not None and not node.is_isolated():
+            node = node.parent
+            if id(node) in dirty:
+                return True
+        return False